@@ -0,0 +1,86 @@
+import atexit
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler que enfileira o LogRecord sem formatá-lo: a montagem da mensagem
+    (incluindo o str() das mensagens lazy) e o I/O ficam no thread do listener.
+    """
+    def prepare(self, record):
+        return record
+
+def install_queue_logging(target_logger, handlers):
+    """
+    Faz target_logger enfileirar seus registros para um QueueListener em thread
+    separado, que os entrega aos handlers informados (ex.: FileHandler).
+
+    :return: O QueueListener iniciado (parado automaticamente no atexit).
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    target_logger.addHandler(DeferredQueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+class QueuedStream:
+    """
+    Substituto de sys.stdout que apenas enfileira o texto; um thread dedicado faz o
+    write/flush no stream original, em ordem, agrupando o que estiver pendente.
+    Assim print() no event loop não bloqueia em consoles lentos.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="stdout-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, data):
+        if data:
+            self._queue.put(data)
+        return len(data)
+
+    def flush(self):
+        # O thread de escrita faz flush após cada lote
+        pass
+
+    def close(self):
+        """Escreve o que estiver pendente e encerra o thread de escrita."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def __getattr__(self, name):
+        # encoding, isatty, fileno etc. vêm do stream original
+        return getattr(self._stream, name)
+
+    def _drain(self):
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        stream = self._stream
+        while True:
+            chunks = [get()]
+            while not self._queue.empty():
+                chunks.append(get_nowait())
+            done = None in chunks
+            try:
+                stream.write("".join(c for c in chunks if c is not None))
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+            if done:
+                return
+
+def install_queued_stdout():
+    """
+    Troca sys.stdout por um QueuedStream (chamar depois do colorama.init(), que também
+    envolve o stdout no Windows).
+
+    :return: O QueuedStream instalado (drenado e encerrado automaticamente no atexit).
+    """
+    stream = QueuedStream(sys.stdout)
+    sys.stdout = stream
+    atexit.register(stream.close)
+    return stream
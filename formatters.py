@@ -1,43 +1,100 @@
-from colorama import Fore, Back, Style
-from datetime import datetime
+import sys
+import time
+
+# Sequências ANSI (equivalentes 1:1 às constantes Fore/Back/Style do colorama).
+# O colorama.init() continua sendo chamado no ponto de entrada para terminais Windows legados.
+BLACK = "\x1b[30m"
+RED = "\x1b[31m"
+GREEN = "\x1b[32m"
+YELLOW = "\x1b[33m"
+MAGENTA = "\x1b[35m"
+CYAN = "\x1b[36m"
+WHITE = "\x1b[37m"
+BG_RED = "\x1b[41m"
+BG_GREEN = "\x1b[42m"
+BG_BLUE = "\x1b[44m"
+BG_CYAN = "\x1b[46m"
+BG_WHITE = "\x1b[47m"
+RESET = "\x1b[0m"
+
+# Prefixos/sufixos de cor pré-computados no carregamento do módulo
+_RESET = RESET
+_OK_PREFIX = GREEN + "✅ "
+_ERROR_PREFIX = RED + "❌ "
+_WARNING_PREFIX = YELLOW + "⚠️ "
+_INFO_PREFIX = CYAN + "ℹ️ "
+_PRICE_PREFIX = MAGENTA
+_HEADER_PREFIX = "\n" + WHITE + BG_BLUE
+_SUBHEADER_PREFIX = BLACK + BG_CYAN
+_POOL_PREFIX = YELLOW + "["
+_POOL_SUFFIX = "]" + RESET
+_SOL_PREFIX = YELLOW
+_SOL_SUFFIX = " SOL" + RESET
+_TIMESTAMP_PREFIX = BLACK + BG_WHITE + " "
+_TIMESTAMP_SUFFIX = " " + RESET
+
+# Prefixos de percentual indexados por (is_positive << 1) | (percent > 0)
+_PERCENT_PREFIXES = (
+    RED,
+    RED,
+    GREEN,
+    GREEN + "+",
+)
 
 # Formatadores para saída no terminal
 def format_success(message):
-    return f"{Fore.GREEN}✅ {message}{Style.RESET_ALL}"
+    return f"{_OK_PREFIX}{message}{_RESET}"
 
 def format_error(message):
-    return f"{Fore.RED}❌ {message}{Style.RESET_ALL}"
+    return f"{_ERROR_PREFIX}{message}{_RESET}"
 
 def format_warning(message):
-    return f"{Fore.YELLOW}⚠️ {message}{Style.RESET_ALL}"
+    return f"{_WARNING_PREFIX}{message}{_RESET}"
 
 def format_info(message):
-    return f"{Fore.CYAN}ℹ️ {message}{Style.RESET_ALL}"
+    return f"{_INFO_PREFIX}{message}{_RESET}"
 
 def format_price(price, precision=8):
-    return f"{Fore.MAGENTA}{price:.{precision}f}{Style.RESET_ALL}"
+    return f"{_PRICE_PREFIX}{price:.{precision}f}{_RESET}"
 
 def format_percent(percent, is_positive=None):
     # Se is_positive não for especificado, determina com base no valor
     if is_positive is None:
         is_positive = percent >= 0
-    
-    color = Fore.GREEN if is_positive else Fore.RED
-    symbol = "+" if is_positive and percent > 0 else ""
-    return f"{color}{symbol}{percent:.2f}%{Style.RESET_ALL}"
+
+    prefix = _PERCENT_PREFIXES[(bool(is_positive) << 1) | (percent > 0)]
+    return f"{prefix}{percent:.2f}%{_RESET}"
 
 def format_header(message):
-    return f"\n{Fore.WHITE}{Back.BLUE}{message.center(78)}{Style.RESET_ALL}"
+    return f"{_HEADER_PREFIX}{message.center(78)}{_RESET}"
 
 def format_subheader(message):
-    return f"{Fore.BLACK}{Back.CYAN}{message.center(78)}{Style.RESET_ALL}"
+    return f"{_SUBHEADER_PREFIX}{message.center(78)}{_RESET}"
 
 def format_pool(pool_name):
-    return f"{Fore.YELLOW}[{pool_name}]{Style.RESET_ALL}"
+    return f"{_POOL_PREFIX}{pool_name}{_POOL_SUFFIX}"
 
 def format_sol(amount):
-    return f"{Fore.YELLOW}{amount:.4f} SOL{Style.RESET_ALL}"
+    return f"{_SOL_PREFIX}{amount:.4f}{_SOL_SUFFIX}"
 
 def format_timestamp():
-    current_time_str = datetime.now().strftime("%H:%M:%S")
-    return f"{Fore.BLACK}{Back.WHITE} {current_time_str} {Style.RESET_ALL}" 
\ No newline at end of file
+    current_time_str = time.strftime("%H:%M:%S")
+    return f"{_TIMESTAMP_PREFIX}{current_time_str}{_TIMESTAMP_SUFFIX}"
+
+class ConsoleBuffer:
+    """
+    Saída de console dos monitores de preço. O agrupamento das escritas fica só com o
+    sys.stdout instalado por install_queued_stdout (QueuedStream): cada linha vai para o
+    stream na hora, na mesma ordem dos print() comuns, e não depende de um event loop.
+    """
+    def emit(self, line, flush=False):
+        """Escreve uma linha; flush=True força o flush do stream (ex.: alertas)."""
+        sys.stdout.write(line + "\n")
+        if flush:
+            sys.stdout.flush()
+
+    def flush(self):
+        sys.stdout.flush()
+
+# Saída compartilhada dos monitores de preço
+console = ConsoleBuffer()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import aiohttp
+import httpx
+
+# Sessão HTTP compartilhada (pool de conexões keep-alive para Raydium/CoinGecko); o Helius
+# usa apenas o cliente HTTP/2 de get_rpc_client
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = asyncio.Lock()
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Retorna a sessão aiohttp compartilhada, criando-a sob demanda.
+    Reutilizar a sessão evita um novo handshake TCP/TLS a cada requisição.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        return _HTTP_SESSION
+    async with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                force_close=False,
+                # Libera transportes SSL que o servidor fechou sem encerrar o TLS
+                enable_cleanup_closed=True
+            )
+            # Limite total por requisição: uma RPC travada não segura o ciclo de venda
+            timeout = aiohttp.ClientTimeout(total=10)
+            _HTTP_SESSION = aiohttp.ClientSession(connector=connector, timeout=timeout)
+    return _HTTP_SESSION
+
+# Cliente HTTP/2, único transporte para o RPC do Helius: requisições simultâneas (saldos,
+# confirmação, timestamp) compartilham uma única conexão multiplexada
+_RPC_CLIENT = None
+
+def get_rpc_client() -> httpx.AsyncClient:
+    """Retorna o cliente httpx (HTTP/2) compartilhado para o Helius, criando-o sob demanda."""
+    global _RPC_CLIENT
+    if _RPC_CLIENT is None or _RPC_CLIENT.is_closed:
+        _RPC_CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=60),
+            timeout=10
+        )
+    return _RPC_CLIENT
+
+# Cliente HTTP/2 para a API do Telegram: notificações simultâneas são multiplexadas
+# na mesma conexão TLS
+_TELEGRAM_CLIENT = None
+
+def get_telegram_client() -> httpx.AsyncClient:
+    """Retorna o cliente httpx (HTTP/2) compartilhado para o Telegram, criando-o sob demanda."""
+    global _TELEGRAM_CLIENT
+    if _TELEGRAM_CLIENT is None or _TELEGRAM_CLIENT.is_closed:
+        _TELEGRAM_CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=60),
+            timeout=5
+        )
+    return _TELEGRAM_CLIENT
+
+# Intervalo do ping getHealth: abaixo do timeout ocioso do Helius, para que a primeira
+# requisição após um período sem trades não pague um novo handshake TCP/TLS
+RPC_KEEPALIVE_INTERVAL = 20
+_GET_HEALTH_BODY = b'{"jsonrpc":"2.0","id":1,"method":"getHealth"}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+async def keep_rpc_warm(url: str, interval: float = RPC_KEEPALIVE_INTERVAL):
+    """
+    Envia getHealth a cada `interval` segundos pelo cliente HTTP/2 do RPC, mantendo a
+    conexão aberta. Roda até ser cancelada.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await get_rpc_client().post(url, content=_GET_HEALTH_BODY, headers=_JSON_HEADERS)
+        except Exception as e:
+            logging.debug("Ping getHealth falhou: %s", e)
+
+async def close_session():
+    """Fecha a sessão e os clientes HTTP/2 compartilhados (chamar no encerramento do bot)."""
+    global _HTTP_SESSION, _RPC_CLIENT, _TELEGRAM_CLIENT
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+    if _RPC_CLIENT is not None and not _RPC_CLIENT.is_closed:
+        await _RPC_CLIENT.aclose()
+    _RPC_CLIENT = None
+    if _TELEGRAM_CLIENT is not None and not _TELEGRAM_CLIENT.is_closed:
+        await _TELEGRAM_CLIENT.aclose()
+    _TELEGRAM_CLIENT = None
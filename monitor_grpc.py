@@ -1,7 +1,16 @@
+import array
 import asyncio
+import functools
+import os
+import struct
+
+# Backend nativo (upb) do protobuf para decodificar os updates da stream; precisa ser
+# definido antes de qualquer import de google.protobuf (geyser_pb2 abaixo)
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 import grpc
-import base58
 import logging
+from solders.pubkey import Pubkey
 from typing import AsyncIterator
 from colorama import Fore, Style, init
 
@@ -14,13 +23,55 @@ import geyser_pb2_grpc
 # Configuração simplificada de logging - apenas para arquivo, não para console
 logger = logging.getLogger("monitor_grpc")
 logger.setLevel(logging.INFO)
+# Os registros propagam para o logger raiz, que no bot já escreve via fila (async_logging)
+
+class _LazyPoolMsg:
+    """
+    Mensagem de pool formatada sob demanda: o logging só chama str() quando
+    algum handler realmente vai consumir o registro.
+    """
+    __slots__ = ("pool_name", "message")
+
+    def __init__(self, pool_name, message):
+        self.pool_name = pool_name
+        self.message = message
+
+    def __str__(self):
+        return f"{Fore.YELLOW}[{self.pool_name}]{Style.RESET_ALL} {self.message}"
 
 # Função para formatar mensagens de pool
 def format_pool_msg(pool_name, message):
-    return f"{Fore.YELLOW}[{pool_name}]{Style.RESET_ALL} {message}"
+    return _LazyPoolMsg(pool_name, message)
 
 SOL_MINT = "So11111111111111111111111111111111111111112"
 
+# 10**i e 1/10**i para os decimais válidos (1..30, validados em decode_liquidity_state)
+_POW10 = tuple(10 ** i for i in range(31))
+_INV_POW10 = tuple(1.0 / p for p in _POW10)
+
+# Índices dos saldos no array preallocado de PriceMonitorGRPC
+BASE_IDX = 0
+QUOTE_IDX = 1
+
+# Layouts binários pré-compilados (little-endian u64)
+_BAL_STRUCT = struct.Struct("<Q")
+# Liquidity state a partir do offset 32: decimais base/quote (u64) e, no offset 336, os pubkeys dos vaults
+_LIQ_STRUCT = struct.Struct("<QQ288x32s32s")
+
+# Opções do canal gRPC para a stream de subscrição (mensagens pequenas e frequentes)
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 15000),
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+]
+
+@functools.lru_cache(maxsize=4096)
+def _b58(raw: bytes) -> str:
+    """Codifica um pubkey em base58, memoizado (os vaults de uma pool não mudam)."""
+    return str(Pubkey.from_bytes(raw))
+
 class TritonAuthMetadataPlugin(grpc.AuthMetadataPlugin):
     """
     Plugin para enviar o x-token em cada chamada gRPC.
@@ -55,39 +106,55 @@ class PriceMonitorGRPC:
         self.base_decimals = None
         self.quote_decimals = None
 
-        self.base_balance = None
-        self.quote_balance = None
+        # Saldos [base, quote] em slots preallocados (0.0 = ainda sem atualização)
+        self._balances = array.array('d', [0.0, 0.0])
 
-        # Fila para atualizações
-        self._update_queue = asyncio.Queue()
+        # Sinaliza que há saldo novo gravado diretamente em _balances
+        self._new_data = asyncio.Event()
         self._subscription_tasks = []
+        # Chamadas gRPC (streams) abertas, canceladas diretamente na camada RPC ao sair
+        self._subscription_calls = []
+        # Motivo do fim da stream dos vaults; stream_price levanta erro a partir daí
+        self._stream_error = None
+
+    @property
+    def base_balance(self):
+        return self._balances[BASE_IDX] or None
+
+    @property
+    def quote_balance(self):
+        return self._balances[QUOTE_IDX] or None
 
     async def __aenter__(self):
         ssl_creds = grpc.ssl_channel_credentials()
         call_creds = grpc.metadata_call_credentials(TritonAuthMetadataPlugin(self.x_token))
         composite_creds = grpc.composite_channel_credentials(ssl_creds, call_creds)
-        self.channel = grpc.aio.secure_channel(self.rpc_fqdn, composite_creds)
+        # Sem compressão: os dados das contas de vault são minúsculos e não compensam o custo de CPU
+        self.channel = grpc.aio.secure_channel(
+            self.rpc_fqdn,
+            composite_creds,
+            options=GRPC_CHANNEL_OPTIONS,
+            compression=grpc.Compression.NoCompression
+        )
         self.stub = geyser_pb2_grpc.GeyserStub(self.channel)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        for task in self._subscription_tasks:
-            task.cancel()
+        # Cancela as streams na camada gRPC; as tarefas consumidoras terminam sozinhas
+        for call in self._subscription_calls:
+            call.cancel()
+        await asyncio.gather(*self._subscription_tasks, return_exceptions=True)
         await self.channel.close()
 
     def decode_liquidity_state(self, data: bytes) -> dict:
         try:
-            decoded = data
-            base_decimal = int.from_bytes(decoded[32:40], 'little')
-            quote_decimal = int.from_bytes(decoded[40:48], 'little')
+            base_decimal, quote_decimal, base_vault_bytes, quote_vault_bytes = _LIQ_STRUCT.unpack_from(data, 32)
             # Verifica se os decimais estão dentro de um intervalo plausível (ex.: entre 1 e 30)
             if not (1 <= base_decimal <= 30 and 1 <= quote_decimal <= 30):
                 logger.info(format_pool_msg(self.config.get("token_pair"), "Ignorando pool CPMM (decimais fora do esperado: base=%d, quote=%d)"), base_decimal, quote_decimal)
                 return {}
-            base_vault_bytes = decoded[336:368]
-            quote_vault_bytes = decoded[368:400]
-            base_vault = base58.b58encode(base_vault_bytes).decode('utf-8')
-            quote_vault = base58.b58encode(quote_vault_bytes).decode('utf-8')
+            base_vault = _b58(base_vault_bytes)
+            quote_vault = _b58(quote_vault_bytes)
             return {
                 "base_decimal": base_decimal,
                 "quote_decimal": quote_decimal,
@@ -98,10 +165,16 @@ class PriceMonitorGRPC:
             logger.error(format_pool_msg(self.config.get("token_pair"), "Erro ao decodificar liquidity state: %s"), e)
             return {}
 
-    async def subscribe_account(self, account_address: str) -> AsyncIterator[geyser_pb2.SubscribeUpdate]:
+    async def subscribe_account(self, account_address) -> AsyncIterator[geyser_pb2.SubscribeUpdate]:
+        """
+        :param account_address: Endereço único ou lista de endereços a serem
+                                incluídos no mesmo filtro de contas (uma única stream).
+        """
         from geyser_pb2 import SubscribeRequest, SubscribeRequestFilterAccounts, CommitmentLevel
+        if isinstance(account_address, str):
+            account_address = [account_address]
         filter_accounts = SubscribeRequestFilterAccounts()
-        filter_accounts.account.extend([account_address])
+        filter_accounts.account.extend(account_address)
         subscribe_request = SubscribeRequest(
             accounts={"accountSubscribe": filter_accounts},
             accounts_data_slice=[],
@@ -110,6 +183,7 @@ class PriceMonitorGRPC:
         async def request_iterator():
             yield subscribe_request
         response_iterator = self.stub.Subscribe(request_iterator())
+        self._subscription_calls.append(response_iterator)
         return response_iterator
 
     async def init_vaults(self):
@@ -117,79 +191,143 @@ class PriceMonitorGRPC:
         token_pair = self.config.get("token_pair", "N/A")
         logger.info(format_pool_msg(token_pair, "Subscrevendo a pool: %s"), pool_address)
         pool_subscription = await self.subscribe_account(pool_address)
-        async for update in pool_subscription:
-            if update.HasField("account"):
-                account_info = update.account.account
-                if hasattr(account_info, "data") and account_info.data:
-                    state = self.decode_liquidity_state(account_info.data)
-                    if state:
-                        base_vault = state.get("base_vault")
-                        quote_vault = state.get("quote_vault")
-                        base_decimals = state.get("base_decimal")
-                        quote_decimals = state.get("quote_decimal")
+        try:
+            async for update in pool_subscription:
+                if update.HasField("account"):
+                    account_info = update.account.account
+                    if account_info.data:
+                        state = self.decode_liquidity_state(account_info.data)
+                        if state:
+                            base_vault = state.get("base_vault")
+                            quote_vault = state.get("quote_vault")
+                            base_decimals = state.get("base_decimal")
+                            quote_decimals = state.get("quote_decimal")
                         
-                        # Para pares com WSOL, usamos a configuração sol_in_quote para determinar
-                        # a ordem correta dos vaults
-                        if self.config.get("sol_in_quote", False):
-                            # Se sol_in_quote é true, mantemos a ordem original
-                            self.base_vault = base_vault
-                            self.quote_vault = quote_vault
-                            self.base_decimals = base_decimals
-                            self.quote_decimals = quote_decimals
-                        else:
-                            # Se sol_in_quote é false, trocamos os vaults
-                            self.base_vault = quote_vault
-                            self.quote_vault = base_vault
-                            self.base_decimals = quote_decimals
-                            self.quote_decimals = base_decimals
+                            # Para pares com WSOL, usamos a configuração sol_in_quote para determinar
+                            # a ordem correta dos vaults
+                            if self.config.get("sol_in_quote", False):
+                                # Se sol_in_quote é true, mantemos a ordem original
+                                self.base_vault = base_vault
+                                self.quote_vault = quote_vault
+                                self.base_decimals = base_decimals
+                                self.quote_decimals = quote_decimals
+                            else:
+                                # Se sol_in_quote é false, trocamos os vaults
+                                self.base_vault = quote_vault
+                                self.quote_vault = base_vault
+                                self.base_decimals = quote_decimals
+                                self.quote_decimals = base_decimals
                             
-                        logger.info(
-                            format_pool_msg(token_pair, "Vaults identificados: base=%s, quote=%s | Decimais: base=%d, quote=%d"),
-                            self.base_vault, self.quote_vault, self.base_decimals, self.quote_decimals
-                        )
-                        break
+                            logger.info(
+                                format_pool_msg(token_pair, "Vaults identificados: base=%s, quote=%s | Decimais: base=%d, quote=%d"),
+                                self.base_vault, self.quote_vault, self.base_decimals, self.quote_decimals
+                            )
+                            break
+        finally:
+            # A stream da pool só é necessária para identificar os vaults; cancelada também
+            # quando a tarefa é cancelada durante a espera pelo primeiro update
+            pool_subscription.cancel()
+            self._subscription_calls.remove(pool_subscription)
         if not self.base_vault or not self.quote_vault:
             logger.error(format_pool_msg(token_pair, "Não foi possível identificar os vaults a partir da pool."))
             raise Exception("Falha na identificação dos vaults")
 
     async def start_update_tasks(self):
         token_pair = self.config.get("token_pair", "N/A")
-        scale_base = 10 ** self.base_decimals if self.base_decimals is not None else 1e9
-        scale_quote = 10 ** self.quote_decimals if self.quote_decimals is not None else 1e6
+        inv_base = _INV_POW10[self.base_decimals if self.base_decimals is not None else 9]
+        inv_quote = _INV_POW10[self.quote_decimals if self.quote_decimals is not None else 6]
+
+        # pubkey (bytes) -> (índice do saldo, 1/escala): despacho com um único lookup por update
+        vaults = {
+            bytes(Pubkey.from_string(self.base_vault)): (BASE_IDX, inv_base),
+            bytes(Pubkey.from_string(self.quote_vault)): (QUOTE_IDX, inv_quote),
+        }
 
-        async def process_subscription(account_address: str, vault_type: str, scale: float):
-            subscription = await self.subscribe_account(account_address)
+        new_data = self._new_data
+        balances = self._balances
+
+        # Uma única stream com os dois vaults no mesmo filtro de contas. A chamada é criada
+        # antes da tarefa para que __aexit__ sempre consiga cancelá-la.
+        subscription = await self.subscribe_account([self.base_vault, self.quote_vault])
+
+        async def process_subscription():
+            # Lookups do loop interno pré-resolvidos em variáveis locais
+            get_vault = vaults.get
+            unpack = _BAL_STRUCT.unpack_from
+            notify = new_data.set
+            log_error = logger.error
             async for update in subscription:
                 if update.HasField("account"):
                     account_info = update.account.account
-                    if hasattr(account_info, "data") and account_info.data:
+                    vault = get_vault(account_info.pubkey)
+                    if vault is None:
+                        continue
+                    idx, inv_scale = vault
+                    decoded = account_info.data
+                    if decoded:
                         try:
-                            decoded = account_info.data
-                            balance_raw = int.from_bytes(decoded[64:72], "little")
-                            balance = float(balance_raw) / scale
-                            await self._update_queue.put((vault_type, balance))
+                            balances[idx] = unpack(decoded, 64)[0] * inv_scale
+                            notify()
                         except Exception as e:
-                            logger.error(format_pool_msg(token_pair, "Erro ao processar atualização do %s: %s"), vault_type, e)
-        task_base = asyncio.create_task(process_subscription(self.base_vault, "base", scale_base))
-        task_quote = asyncio.create_task(process_subscription(self.quote_vault, "quote", scale_quote))
-        self._subscription_tasks.extend([task_base, task_quote])
+                            log_error(format_pool_msg(token_pair, "Erro ao processar atualização do %s: %s"), "base" if idx == BASE_IDX else "quote", e)
+        task = asyncio.create_task(process_subscription())
+        task.add_done_callback(self._on_subscription_done)
+        self._subscription_tasks.append(task)
 
-    async def stream_price(self) -> AsyncIterator[float]:
-        token_pair = self.config.get("token_pair", "N/A")
+    def _on_subscription_done(self, task):
+        """
+        A stream dos vaults terminou (erro, encerramento pelo servidor ou cancelamento):
+        registra o motivo e acorda stream_price, que repassa o erro ao chamador.
+        """
+        if task.cancelled():
+            # Cancelamento em __aexit__: encerramento normal
+            self._stream_error = ConnectionError("stream dos vaults cancelada")
+        else:
+            self._stream_error = task.exception() or ConnectionError("stream dos vaults encerrada pelo servidor")
+            logger.error(format_pool_msg(self.config.get("token_pair"), "Stream de saldos encerrada: %s"), self._stream_error)
+        self._new_data.set()
+
+    async def start(self):
+        """
+        Identifica os vaults e abre a subscrição dos saldos. Chamadas repetidas não
+        reabrem a stream.
+        """
         if self.base_vault is None or self.quote_vault is None:
             await self.init_vaults()
             await self.start_update_tasks()
+
+    async def stream_price(self) -> AsyncIterator[float]:
+        token_pair = self.config.get("token_pair", "N/A")
+        await self.start()
         last_logged_price = None
+        last_yielded_price = None
         PRICE_CHANGE_THRESHOLD = 0.0001
+        # Variação relativa mínima para emitir um novo preço (abaixo disso é ruído)
+        price_yield_threshold = self.config.get("price_yield_threshold", 0.00001)
+        PRICE_COALESCE_WINDOW = 0.001  # segundos
+        wait_new_data = self._new_data.wait
+        clear_new_data = self._new_data.clear
+        sleep = asyncio.sleep
+        log_info = logger.info
+        balances = self._balances
         while True:
-            vault_type, balance = await self._update_queue.get()
-            if vault_type == "base":
-                self.base_balance = balance
-            elif vault_type == "quote":
-                self.quote_balance = balance
-            if self.base_balance is not None and self.quote_balance is not None and self.quote_balance != 0:
-                price = self.quote_balance / self.base_balance
+            # Checado antes de cada espera: um erro registrado durante a janela de agregação
+            # (quando o clear abaixo apaga o evento) ou antes desta chamada não bloqueia o wait
+            if self._stream_error is not None:
+                raise ConnectionError(f"Stream de preços da pool {token_pair} encerrada") from self._stream_error
+            await wait_new_data()
+            if self._stream_error is not None:
+                continue
+            # Agrega a rajada de updates (mesmo slot) e emite apenas o preço mais recente
+            await sleep(PRICE_COALESCE_WINDOW)
+            clear_new_data()
+            base_balance, quote_balance = balances
+            if base_balance and quote_balance:
+                price = quote_balance / base_balance
+                if last_yielded_price is not None and abs(price - last_yielded_price) / last_yielded_price <= price_yield_threshold:
+                    continue
                 if last_logged_price is None or abs(price - last_logged_price) / last_logged_price > PRICE_CHANGE_THRESHOLD:
-                    logger.info(format_pool_msg(token_pair, "Novo preço calculado: %.10f"), price)
+                    log_info(format_pool_msg(token_pair, "Novo preço calculado: %.10f"), price)
                     last_logged_price = price
+                last_yielded_price = price
                 yield price
@@ -1,45 +1,53 @@
 import asyncio
-import json
 import logging
 import os
 import time
 import base58
-from dotenv import load_dotenv
-import aiohttp
-from datetime import datetime, timezone
-from colorama import Fore, Back, Style, init
-import sys
 import random
+from collections import OrderedDict, deque
+import contextlib
+from contextlib import AsyncExitStack
+from dotenv import load_dotenv
+import orjson
+from dataclasses import dataclass
+from datetime import datetime
+from colorama import init
 import traceback
 
 # Inicializa o colorama para funcionar corretamente no Windows
 init()
 
+# A escrita no terminal roda em um thread dedicado: print() no event loop apenas enfileira
+from async_logging import install_queue_logging, install_queued_stdout
+install_queued_stdout()
+
 # Garante que o diretório de logs existe
 os.makedirs("logs", exist_ok=True)
 
-# Configuração de logging - direcionar logs para arquivo e não para console
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/bot.log"),
-        # Removendo o StreamHandler para evitar saída duplicada no console
-    ]
-)
+# Configuração de logging - direcionar logs para arquivo e não para console.
+# O FileHandler roda em um QueueListener (thread separado) para que a escrita em disco
+# não bloqueie o event loop; os loggers apenas enfileiram os registros.
+_file_handler = logging.FileHandler("logs/bot.log")
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.getLogger().setLevel(logging.INFO)
+install_queue_logging(logging.getLogger(), [_file_handler])
 
 # Importando funções de formatação
 from formatters import (
     format_success, format_error, format_warning, format_info, 
     format_price, format_percent, format_header, format_subheader,
-    format_pool, format_sol, format_timestamp
+    format_pool, format_sol, format_timestamp, console,
+    BLACK, RED, GREEN, YELLOW, MAGENTA, CYAN, WHITE, BG_RED, BG_GREEN, RESET
 )
 
-from trader import RaydiumTrader, verify_transaction_status
+from trader import (
+    RaydiumTrader, get_token_balance, verify_transaction_status, fatal_instruction_error,
+    wait_signature_notification
+)
 from monitor_grpc import PriceMonitorGRPC
 from bxsolana.provider.http import http  # Utiliza o provider http
-from bxsolana.provider import constants
 from telegram_notifier import TelegramNotifier  # Importação do notificador Telegram
+from http_session import get_session, get_rpc_client, close_session, keep_rpc_warm
 
 load_dotenv()
 
@@ -48,17 +56,16 @@ AUTH_HEADER = os.getenv("AUTH_HEADER", "").replace('[', '').replace(']', '')
 PUBLIC_KEY = os.getenv("PUBLIC_KEY", "")
 PRIVATE_KEY_ENV = os.getenv("PRIVATE_KEY", "SUA_PRIVATE_KEY")
 
+# Decodifica a chave uma única vez no import; PRIVATE_KEY fica como bytes
 if PRIVATE_KEY_ENV:
     try:
-        if PRIVATE_KEY_ENV.strip().startswith('['):
-            key_list = json.loads(PRIVATE_KEY_ENV)
-            key_bytes = bytes(key_list)
-            PRIVATE_KEY = list(key_bytes)
-            PRIVATE_KEY_BASE58 = base58.b58encode(key_bytes).decode('utf-8')
-        else:
+        try:
             PRIVATE_KEY_BASE58 = PRIVATE_KEY_ENV.strip()
-            key_bytes = base58.b58decode(PRIVATE_KEY_BASE58)
-            PRIVATE_KEY = list(key_bytes)
+            PRIVATE_KEY = base58.b58decode(PRIVATE_KEY_BASE58)
+        except ValueError:
+            # Formato JSON: lista de inteiros ([12, 34, ...])
+            PRIVATE_KEY = bytes(orjson.loads(PRIVATE_KEY_ENV))
+            PRIVATE_KEY_BASE58 = base58.b58encode(PRIVATE_KEY).decode('utf-8')
     except Exception as e:
         raise ValueError(f"Erro ao processar PRIVATE_KEY. Se estiver em formato JSON, verifique a formatação. Detalhes: {e}")
 else:
@@ -70,22 +77,51 @@ if PRIVATE_KEY_BASE58:
 os.environ["AUTH_HEADER"] = AUTH_HEADER
 os.environ["PUBLIC_KEY"] = PUBLIC_KEY
 
+# Endpoint e token do gRPC lidos uma única vez
+GRPC_RPC_FQDN = os.getenv("GRPC_RPC_FQDN", "inseminates-nutritionally-afnmdcxbdf-dedicated-lb.helius-rpc.com:2053")
+GRPC_X_TOKEN = os.getenv("GRPC_X_TOKEN", "")
+
+# Chave e URLs do Helius montadas uma única vez (None quando a chave não está configurada)
+HELIUS_API_KEY = os.getenv("HELIUS_API_KEY", "")
+HELIUS_RPC_URL = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}" if HELIUS_API_KEY else None
+
+# Tempo máximo que um monitor ocupa um slot de inicialização: uma pool sem updates libera
+# o slot e continua aguardando o primeiro update fora dele
+STARTUP_SLOT_TIMEOUT = 5.0
+
 def load_trade_config():
-    with open("config.json", "r") as f:
-        config = json.load(f)
+    with open("config.json", "rb") as f:
+        config = orjson.loads(f.read())
     return config
 
-def chunk_list(lst, size):
-    for i in range(0, len(lst), size):
-        yield lst[i:i + size]
+# Cache de /pools/info/mint por token: token_mint -> (instante monotônico, pool_info)
+POOL_INFO_TTL = 60  # segundos
+_pool_info_cache = {}
+_pool_info_locks = {}
 
 async def get_pool_info_by_token(token_mint: str):
     """
     Obtém informações da pool usando o endpoint /pools/info/mint da API da Raydium.
+    Resultados encontrados ficam em cache por POOL_INFO_TTL segundos; chamadas
+    concorrentes para o mesmo token aguardam uma única requisição.
     
     :param token_mint: Endereço do token (out_token)
     :return: Configuração da pool ou None se não encontrada
     """
+    hit = _pool_info_cache.get(token_mint)
+    if hit and time.monotonic() - hit[0] < POOL_INFO_TTL:
+        return hit[1]
+    lock = _pool_info_locks.setdefault(token_mint, asyncio.Lock())
+    async with lock:
+        hit = _pool_info_cache.get(token_mint)
+        if hit and time.monotonic() - hit[0] < POOL_INFO_TTL:
+            return hit[1]
+        pool_info = await _fetch_pool_info_by_token(token_mint)
+        if pool_info is not None:
+            _pool_info_cache[token_mint] = (time.monotonic(), pool_info)
+        return pool_info
+
+async def _fetch_pool_info_by_token(token_mint: str):
     sol_mint = "So11111111111111111111111111111111111111112"
     base_url = 'https://api-v3.raydium.io/pools/info/mint'
     params = {
@@ -98,61 +134,58 @@ async def get_pool_info_by_token(token_mint: str):
         "page": 1
     }
     
-    async with aiohttp.ClientSession() as session:
-        url = (f"{base_url}?mint1={params['mint1']}&mint2={params['mint2']}"
-               f"&poolType={params['poolType']}&poolSortField={params['poolSortField']}"
-               f"&sortType={params['sortType']}&pageSize={params['pageSize']}&page={params['page']}")
-        async with session.get(url) as response:
-            if response.status != 200:
-                print(f"Erro ao obter informações da pool para o token {token_mint}: {response.status}")
-                return None
-            response_json = await response.json()
-        
-        data_obj = response_json.get("data", {})
-        pools_list = data_obj.get("data", [])
-        
-        if not pools_list:
-            print(f"Nenhuma pool encontrada para o token {token_mint}")
+    session = await get_session()
+    async with session.get(base_url, params=params) as response:
+        if response.status != 200:
+            print(f"Erro ao obter informações da pool para o token {token_mint}: {response.status}")
             return None
-        
-        # Pegamos a primeira pool encontrada
-        pool = pools_list[0]
-        
-        # Construímos o nome da pool com base nos tokens
-        mintA = pool.get("mintA", {})
-        mintB = pool.get("mintB", {})
-        
-        # Determinamos a posição do SOL na resposta da API
-        sol_is_mintA = mintA.get("address") == sol_mint
-        
-        if sol_is_mintA:
-            non_sol_mint = mintB
-            pool_name = f"{mintB.get('symbol')}/WSOL"
-            sol_reserve = pool.get("mintAmountA", 0)
-        else:
-            non_sol_mint = mintA
-            pool_name = f"{mintA.get('symbol')}/WSOL"
-            sol_reserve = pool.get("mintAmountB", 0)
-        
-        # Obtém dados adicionais úteis da pool
-        volume_24h = pool.get("day", {}).get("volume", 0)
-        tvl = pool.get("tvl", 0)
-        
-        print(f"{format_info('Pool encontrada:')} {format_pool(pool_name)}")
-        print(f"  • Reserva: {format_sol(sol_reserve)}  • TVL: {format_sol(tvl)}  • Volume 24h: {format_sol(volume_24h)}")
-        
-        # Retornamos a configuração da pool
-        return {
-            "pool_address": pool.get("id"),
-            "token1_mint_address": non_sol_mint.get("address"),
-            "token2_mint_address": sol_mint,
-            "token1_mint_symbol": non_sol_mint.get("symbol"),
-            "token2_mint_symbol": "WSOL",
-            "sol_reserve": sol_reserve,
-            "sol_decimals": mintA.get("decimals") if sol_is_mintA else mintB.get("decimals"),
-            "pool": pool_name,
-            "sol_is_mintA": sol_is_mintA  # Adicionamos esta informação
-        }
+        response_json = orjson.loads(await response.read())
+    
+    data_obj = response_json.get("data", {})
+    pools_list = data_obj.get("data", [])
+    
+    if not pools_list:
+        print(f"Nenhuma pool encontrada para o token {token_mint}")
+        return None
+    
+    # Pegamos a primeira pool encontrada
+    pool = pools_list[0]
+    
+    # Construímos o nome da pool com base nos tokens
+    mintA = pool.get("mintA", {})
+    mintB = pool.get("mintB", {})
+    
+    # Determinamos a posição do SOL na resposta da API
+    sol_is_mintA = mintA.get("address") == sol_mint
+    
+    if sol_is_mintA:
+        non_sol_mint = mintB
+        pool_name = f"{mintB.get('symbol')}/WSOL"
+        sol_reserve = pool.get("mintAmountA", 0)
+    else:
+        non_sol_mint = mintA
+        pool_name = f"{mintA.get('symbol')}/WSOL"
+        sol_reserve = pool.get("mintAmountB", 0)
+    
+    # Obtém dados adicionais úteis da pool
+    volume_24h = pool.get("day", {}).get("volume", 0)
+    tvl = pool.get("tvl", 0)
+    
+    print(f"{format_info('Pool encontrada:')} {format_pool(pool_name)}")
+    print(f"  • Reserva: {format_sol(sol_reserve)}  • TVL: {format_sol(tvl)}  • Volume 24h: {format_sol(volume_24h)}")
+    
+    # Retornamos a configuração da pool
+    return {
+        "pool_address": pool.get("id"),
+        "token1_mint_address": non_sol_mint.get("address"),
+        "token2_mint_address": sol_mint,
+        "token1_mint_symbol": non_sol_mint.get("symbol"),
+        "token2_mint_symbol": "WSOL",
+        "sol_reserve": sol_reserve,
+        "sol_decimals": mintA.get("decimals") if sol_is_mintA else mintB.get("decimals"),
+        "pool": pool_name,
+        "sol_is_mintA": sol_is_mintA  # Adicionamos esta informação
+    }
 
 async def build_pool_config_from_token(token_config, trade_config):
     """
@@ -164,7 +197,7 @@ async def build_pool_config_from_token(token_config, trade_config):
     """
     # Obtém informações da pool via API
     token_mint = token_config.get("out_token")
-    print(f"Verificando token: {Fore.CYAN}{token_mint}{Style.RESET_ALL}")
+    print(f"Verificando token: {CYAN}{token_mint}{RESET}")
     pool_info = await get_pool_info_by_token(token_mint)
     
     if not pool_info:
@@ -188,6 +221,9 @@ async def build_pool_config_from_token(token_config, trade_config):
     # Se o token_pair não foi definido, use o nome da pool da API
     token_pair = token_config.get("token_pair") or pool_info.get("pool")
     
+    # Nomes dos tokens do par separados uma única vez (ex.: "BONK/WSOL" -> "BONK", "WSOL")
+    base_token, _, quote_token = token_pair.partition('/')
+    
     # Usa o pair_address da configuração manual ou da API
     pair_address = token_config.get("pair_address") or pool_info.get("pool_address")
     
@@ -208,6 +244,8 @@ async def build_pool_config_from_token(token_config, trade_config):
     
     config = {
         "token_pair": token_pair,
+        "base_token": base_token,
+        "quote_token": quote_token,
         "pair_address": pair_address,
         "owner_address": trade_config["owner_address"],
         "price_drop_percentage": trade_config["price_drop_percentage"],
@@ -224,6 +262,10 @@ async def build_pool_config_from_token(token_config, trade_config):
         "sol_in_quote": sol_in_quote  # Definimos sol_in_quote
     }
     
+    # Limiar opcional de variação mínima para o monitor emitir um novo preço
+    if "price_yield_threshold" in trade_config:
+        config["price_yield_threshold"] = trade_config["price_yield_threshold"]
+    
     # Se existirem campos adicionais na configuração do token, adicione-os
     for key, value in token_config.items():
         if key not in config and key != "out_token":
@@ -231,11 +273,112 @@ async def build_pool_config_from_token(token_config, trade_config):
     
     return config
 
-async def monitor_pool(pool_config):
-    grpc_rpc_fqdn = os.getenv("GRPC_RPC_FQDN", "inseminates-nutritionally-afnmdcxbdf-dedicated-lb.helius-rpc.com:2053")
-    grpc_x_token = os.getenv("GRPC_X_TOKEN", "")
-    monitor = PriceMonitorGRPC(pool_config, grpc_rpc_fqdn, grpc_x_token)
+# Notificações do Telegram rodam em segundo plano, fora do caminho crítico do trade
+NOTIFY_CONCURRENCY = 4
+NOTIFY_MAX_PENDING = 256
+NOTIFY_DRAIN_TIMEOUT = 10.0  # segundos
+# Corrotinas aguardando um slot de envio (ainda não iniciadas), em ordem de chegada
+_queued_notifications = deque()
+# Envios em andamento (no máximo NOTIFY_CONCURRENCY)
+_sending_notifications = set()
+
+async def _send_notification(coro):
+    try:
+        await coro
+    except Exception:
+        logging.exception("Erro ao enviar notificação do Telegram")
+
+def notify(coro):
+    """
+    Agenda o envio de uma notificação (corrotina do TelegramNotifier) sem aguardá-lo.
+    No máximo NOTIFY_CONCURRENCY envios simultâneos; erros são apenas registrados no log.
+    Com NOTIFY_MAX_PENDING notificações na fila, a mais antiga ainda não iniciada é
+    descartada (envios em andamento nunca são interrompidos).
+    """
+    if len(_queued_notifications) >= NOTIFY_MAX_PENDING:
+        # Fechada sem ter sido iniciada: sem aviso de corrotina nunca aguardada
+        _queued_notifications.popleft().close()
+        logging.warning("Fila de notificações cheia; notificação mais antiga descartada")
+    _queued_notifications.append(coro)
+    _start_notifications()
+
+def _start_notifications():
+    while _queued_notifications and len(_sending_notifications) < NOTIFY_CONCURRENCY:
+        task = asyncio.create_task(_send_notification(_queued_notifications.popleft()))
+        _sending_notifications.add(task)
+        task.add_done_callback(_notification_done)
+
+def _notification_done(task):
+    _sending_notifications.discard(task)
+    _start_notifications()
+
+async def drain_notifications(timeout: float = NOTIFY_DRAIN_TIMEOUT):
+    """
+    Aguarda as notificações pendentes por até `timeout` segundos (chamar no encerramento
+    do bot); as que sobrarem são descartadas.
+    """
+    deadline = time.monotonic() + timeout
+    while _sending_notifications:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.wait(set(_sending_notifications), timeout=remaining)
+    # Esvazia a fila antes de cancelar: os callbacks de término não iniciam novos envios
+    dropped = len(_queued_notifications) + len(_sending_notifications)
+    while _queued_notifications:
+        _queued_notifications.popleft().close()
+    leftover = list(_sending_notifications)
+    for task in leftover:
+        task.cancel()
+    if leftover:
+        await asyncio.gather(*leftover, return_exceptions=True)
+    if dropped:
+        logging.warning("%d notificação(ões) descartada(s) no encerramento após %.1fs", dropped, timeout)
+
+# Trabalho auxiliar (ex.: timestamp da blockchain) separado do caminho crítico de compra/venda:
+# roda em tarefas próprias, nunca aguardadas pelo ciclo de trade
+_background_tasks = set()
+
+def spawn_background(coro):
+    """Executa coro em segundo plano, mantendo uma referência forte até o término."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+async def cancel_background_tasks():
+    """Cancela o trabalho auxiliar pendente (chamar no encerramento do bot)."""
+    for task in _background_tasks:
+        task.cancel()
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+def schedule_monitoring_header(interval=300):
+    """
+    Agenda no event loop o cabeçalho com a hora atual a cada `interval` segundos.
+
+    :return: Função que cancela o agendamento.
+    """
+    loop = asyncio.get_running_loop()
+    handle = None
+
+    def print_header():
+        nonlocal handle
+        console.emit(f"\n{format_timestamp()} Monitoramento em andamento...")
+        handle = loop.call_later(interval, print_header)
+
+    handle = loop.call_later(interval, print_header)
+    return lambda: handle.cancel()
+
+async def monitor_pool(pool_config, monitor, notifier, startup_slots=None):
+    """
+    :param monitor: PriceMonitorGRPC já aberto para a pool (compartilhado com monitor_profit).
+    :param notifier: TelegramNotifier compartilhado, usado no alerta de queda.
+    :param startup_slots: asyncio.Semaphore opcional que limita quantos monitores
+                          abrem canal/subscrição gRPC ao mesmo tempo.
+    """
     pool_name = pool_config['token_pair']
+    pool_prefix = format_pool(pool_name)  # prefixo colorido montado uma única vez
     previous_price = None
     last_print_time = 0
     print_interval = 10  # segundos
@@ -243,100 +386,148 @@ async def monitor_pool(pool_config):
     notification_interval = 3600  # enviar notificação a cada 1 hora
     
     # Adicionar variáveis para rastreamento de preços e proteção contra MEV
-    price_history = []  # Lista de tuplas (preço, timestamp)
+    # Deque monotônica de (timestamp, preço) com preços crescentes: a cabeça é o mínimo da
+    # janela, com custo O(1) amortizado por tick e sem limite fixo de ticks na janela
+    price_window = deque()
     price_history_window = 60  # Janela de tempo em segundos para rastrear preços
     suspicious_pump_threshold = pool_config.get("mev_protection_pump_threshold", 5)  # % de alta para detectar pump de MEV
     mev_protection_time_window = pool_config.get("mev_protection_time_window", 30)  # Tempo em segundos para considerar queda após pump como suspeita
     recent_pump_detected = False
     pump_timestamp = 0
     
-    async with monitor as m:
-        async for price in m.stream_price():
-            current_time = time.time()
+    # Limites de queda lidos uma vez, fora do loop de preços
+    min_drop = pool_config.get("price_drop_percentage", 7)
+    max_drop = pool_config.get("max_price_drop_percentage", 37)
+    
+    if startup_slots is not None:
+        start_task = None
+        try:
+            async with startup_slots:
+                start_task = asyncio.ensure_future(monitor.start())
+                await asyncio.wait((start_task,), timeout=STARTUP_SLOT_TIMEOUT)
+            await start_task
+        finally:
+            # Cancelamento (ou erro) durante a espera não deixa a inicialização órfã
+            if start_task is not None and not start_task.done():
+                start_task.cancel()
+    async for price in monitor.stream_price():
+        # Relógio monotônico para janelas, intervalos e drop_monotonic
+        current_time = time.monotonic()
+        
+        # Preços maiores ou iguais ao atual nunca mais serão o mínimo da janela
+        while price_window and price_window[-1][1] >= price:
+            price_window.pop()
+        price_window.append((current_time, price))
+        # Descarta o que saiu da janela; o preço atual sempre fica, então a deque nunca esvazia
+        window_start = current_time - price_history_window
+        while price_window[0][0] <= window_start:
+            price_window.popleft()
+        window_min = price_window[0][1]
+        
+        if previous_price is None:
+            previous_price = price
+            console.emit(f"{pool_prefix} Preço inicial: {format_price(price, 10)}")
+        else:
+            delta = ((previous_price - price) / previous_price) * 100
+            is_drop = delta > 0
             
-            # Adiciona preço atual ao histórico
-            price_history.append((price, current_time))
+            # Se não é queda (é alta), verifica se houve alta súbita em relação ao mínimo da
+            # janela (possível pump de MEV), inclusive quando distribuída em vários ticks
+            pump_percentage = ((price - window_min) / window_min) * 100
+            if not is_drop and pump_percentage >= suspicious_pump_threshold:
+                already_flagged = recent_pump_detected
+                recent_pump_detected = True
+                pump_timestamp = current_time
+                if not already_flagged:
+                    console.emit(f"{pool_prefix} {MAGENTA}⚠️ ALTA SÚBITA DETECTADA: {format_percent(pump_percentage, True)} (possível MEV){RESET}")
             
-            # Remove preços antigos que estão fora da janela de tempo
-            price_history = [p for p in price_history if current_time - p[1] <= price_history_window]
+            # Verifica se o pump foi recente
+            if recent_pump_detected and (current_time - pump_timestamp > mev_protection_time_window):
+                recent_pump_detected = False  # Reseta o flag após o período de proteção
+                console.emit(f"{pool_prefix} {CYAN}ℹ️ Período de proteção MEV encerrado{RESET}")
             
-            if previous_price is None:
-                previous_price = price
-                print(f"{format_pool(pool_name)} Preço inicial: {format_price(price, 10)}")
-            else:
-                delta = ((previous_price - price) / previous_price) * 100
-                is_drop = delta > 0
-                
-                # Se não é queda (é alta), verifica se é uma alta súbita (possível pump de MEV)
-                if not is_drop and abs(delta) >= suspicious_pump_threshold:
-                    recent_pump_detected = True
-                    pump_timestamp = current_time
-                    pump_percentage = abs(delta)
-                    print(f"{format_pool(pool_name)} {Fore.MAGENTA}⚠️ ALTA SÚBITA DETECTADA: {format_percent(pump_percentage, True)} (possível MEV){Style.RESET_ALL}")
-                
-                # Verifica se o pump foi recente
-                if recent_pump_detected and (current_time - pump_timestamp > mev_protection_time_window):
-                    recent_pump_detected = False  # Reseta o flag após o período de proteção
-                    print(f"{format_pool(pool_name)} {Fore.CYAN}ℹ️ Período de proteção MEV encerrado{Style.RESET_ALL}")
-                
-                # Simplifica a saída para mostrar mudanças significativas ou periodicamente
-                should_print = (abs(delta) >= 1.0 or 
-                               (current_time - last_print_time >= print_interval))
-                
-                # Imprime cabeçalho com hora atual a cada 5 minutos
-                if int(current_time) % 300 < 1:
-                    print(f"\n{format_timestamp()} Monitoramento em andamento...")
-                
-                if should_print:
-                    direction = "↓" if is_drop else "↑"
-                    print(f"{format_pool(pool_name)} {direction} {format_price(price, 10)} | {format_percent(delta, not is_drop)}")
-                    last_print_time = current_time
-                
-                # Removendo notificação de quedas significativas que não resultam em compra
-                
-                min_drop = pool_config.get("price_drop_percentage", 7)
-                max_drop = pool_config.get("max_price_drop_percentage", 37)
-                
-                if delta >= min_drop and delta <= max_drop:
-                    # Verifica se estamos no período de proteção MEV após um pump
-                    if recent_pump_detected:
-                        print(f"{format_pool(pool_name)} {Fore.YELLOW}🛡️ QUEDA APÓS PUMP DETECTADA {Style.RESET_ALL} {format_percent(delta)}")
-                        print(f"  Ignorando possível manipulação de preço (MEV). Queda: {format_percent(delta)}")
-                    else:
-                        pool_config["drop_timestamp"] = time.time()
-                        pool_config["triggered_price"] = price
-                        print(f"\n{format_pool(pool_name)} {Fore.WHITE}{Back.RED} ALERTA: QUEDA DETECTADA {Style.RESET_ALL} {format_percent(delta)}")
-                        print(f"  Preço atual: {format_price(price)} | Queda: {format_percent(delta)}")
-                        
-                        # Adicionar notificação de alerta de preço
-                        from telegram_notifier import TelegramNotifier
-                        notifier = TelegramNotifier()
-                        await notifier.send_price_alert(
-                            pool_name.split('/')[0],  # Nome do token
-                            price,                     # Preço atual
-                            delta,                    # Percentual de queda
-                            previous_price,           # Preço anterior
-                            {
-                                "tvl": pool_config.get("tvl", 0),
-                                "volume_24h": pool_config.get("volume_24h", 0),
-                                "sol_reserve": pool_config.get("sol_reserve", 0)
-                            }
-                        )
-                        
-                        return pool_config
-                elif delta > max_drop:
-                    print(f"{format_pool(pool_name)} {format_warning(f'Queda de {delta:.2f}% excede o limite máximo de {max_drop}%; ignorando.')}")
-                
-                previous_price = price
+            # Simplifica a saída para mostrar mudanças significativas ou periodicamente
+            should_print = (abs(delta) >= 1.0 or 
+                           (current_time - last_print_time >= print_interval))
+            
+            if should_print:
+                direction = "↓" if is_drop else "↑"
+                console.emit(f"{pool_prefix} {direction} {format_price(price, 10)} | {format_percent(delta, not is_drop)}")
+                last_print_time = current_time
+            
+            # Removendo notificação de quedas significativas que não resultam em compra
+            
+            if delta >= min_drop and delta <= max_drop:
+                # Verifica se estamos no período de proteção MEV após um pump
+                if recent_pump_detected:
+                    console.emit(f"{pool_prefix} {YELLOW}🛡️ QUEDA APÓS PUMP DETECTADA {RESET} {format_percent(delta)}")
+                    console.emit(f"  Ignorando possível manipulação de preço (MEV). Queda: {format_percent(delta)}")
+                else:
+                    # drop_timestamp (tempo de parede) para exibição e comparação com o blockTime;
+                    # drop_monotonic para medir o tempo decorrido
+                    pool_config["drop_timestamp"] = time.time()
+                    pool_config["drop_monotonic"] = current_time
+                    pool_config["triggered_price"] = price
+                    console.emit(f"\n{pool_prefix} {WHITE}{BG_RED} ALERTA: QUEDA DETECTADA {RESET} {format_percent(delta)}")
+                    console.emit(f"  Preço atual: {format_price(price)} | Queda: {format_percent(delta)}", flush=True)
+                    
+                    # Adicionar notificação de alerta de preço
+                    notify(notifier.send_price_alert(
+                        pool_config['base_token'],  # Nome do token
+                        price,                     # Preço atual
+                        delta,                    # Percentual de queda
+                        previous_price,           # Preço anterior
+                        {
+                            "tvl": pool_config.get("tvl", 0),
+                            "volume_24h": pool_config.get("volume_24h", 0),
+                            "sol_reserve": pool_config.get("sol_reserve", 0)
+                        }
+                    ))
+                    
+                    return pool_config
+            elif delta > max_drop:
+                console.emit(f"{pool_prefix} {format_warning(f'Queda de {delta:.2f}% excede o limite máximo de {max_drop}%; ignorando.')}")
+            
+            previous_price = price
     return None
 
-async def get_transaction_time(signature: str, api_key: str) -> int:
+# Cache de blockTime por assinatura: signature -> Task da consulta (LRU limitado)
+TX_TIME_CACHE_SIZE = 1024
+_tx_time_cache = OrderedDict()
+
+async def get_transaction_time(signature: str) -> int:
+    """
+    Retorna o blockTime da transação, consultando o Helius uma única vez por assinatura.
+    Chamadas concorrentes para a mesma assinatura aguardam a mesma consulta; resultados
+    0 (blockTime indisponível) não ficam em cache.
+    """
+    task = _tx_time_cache.get(signature)
+    if task is None:
+        task = asyncio.create_task(_fetch_transaction_time(signature))
+        _tx_time_cache[signature] = task
+        if len(_tx_time_cache) > TX_TIME_CACHE_SIZE:
+            _tx_time_cache.popitem(last=False)
+    else:
+        _tx_time_cache.move_to_end(signature)
+    # shield: o cancelamento de quem aguarda não interrompe a consulta compartilhada
+    try:
+        block_time = await asyncio.shield(task)
+    except Exception:
+        # Consulta com erro não fica em cache: a próxima chamada tenta de novo
+        if _tx_time_cache.get(signature) is task:
+            del _tx_time_cache[signature]
+        raise
+    if not block_time and _tx_time_cache.get(signature) is task:
+        del _tx_time_cache[signature]
+    return block_time
+
+async def _fetch_transaction_time(signature: str) -> int:
     """
     Consulta o endpoint getTransaction para obter o blockTime (timestamp Unix)
     da transação finalizada, utilizando o commitment "finalized".
     Se o blockTime não estiver disponível, retorna 0.
     """
-    url = f"https://mainnet.helius-rpc.com/?api-key={api_key}"
+    url = HELIUS_RPC_URL
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
@@ -344,95 +535,278 @@ async def get_transaction_time(signature: str, api_key: str) -> int:
         "params": [signature, {"commitment": "finalized"}]
     }
     timeout = 30
-    start = time.time()
-    while time.time() - start < timeout:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                data = await response.json()
-                result = data.get("result")
-                if result and result.get("blockTime") is not None:
-                    return result["blockTime"]
-        await asyncio.sleep(1)
-    return 0
-
-async def monitor_profit(pool_config, buy_price):
-    grpc_rpc_fqdn = os.getenv("GRPC_RPC_FQDN", "inseminates-nutritionally-afnmdcxbdf-dedicated-lb.helius-rpc.com:2053")
-    grpc_x_token = os.getenv("GRPC_X_TOKEN", "7ceb5e41-f6ea-4197-8ba1-90cf23b92a5a")
-    from monitor_grpc import PriceMonitorGRPC
-    monitor = PriceMonitorGRPC(pool_config, grpc_rpc_fqdn, grpc_x_token)
-    pool_config["reference_price"] = buy_price
+    # Backoff exponencial entre consultas: 0.25s, 0.375s, ... até 5s
+    delay = 0.25
+    max_delay = 5.0
+    deadline = time.monotonic() + timeout
+    client = get_rpc_client()
+    while True:
+        response = await client.post(url, json=payload)
+        data = orjson.loads(response.content)
+        result = data.get("result")
+        if result and result.get("blockTime") is not None:
+            return result["blockTime"]
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 0
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, max_delay)
+
+async def wait_balance_ready(owner: str, token_mint: str, expected_amount: float, timeout: float = 2.0) -> bool:
+    """
+    Aguarda o saldo do token refletir a compra (>= 99% de expected_amount), consultando
+    a cada 100ms, por no máximo `timeout` segundos (o antigo intervalo fixo antes da venda).
+    :return: True se o saldo ficou pronto antes do prazo.
+    """
+    deadline = time.monotonic() + timeout
+    threshold = expected_amount * 0.99
+    while True:
+        try:
+            # ttl=0: cada consulta precisa ser nova para ver o saldo mudar
+            balance = await get_token_balance(owner, token_mint, ttl=0)
+            if balance and balance >= threshold:
+                return True
+        except Exception as e:
+            logging.warning("Erro ao consultar saldo antes da venda: %s", e)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(0.1, remaining))
+
+# Espera antes de reconectar após erro no loop principal (gRPC/provider)
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 60.0
+
+# Venda concorrente (opcional, "concurrent_sell" em sell_settings): variantes com fees
+# diferentes são enviadas juntas e vale a primeira aceita. Todas vendem o saldo inteiro, então
+# no máximo uma é executada on-chain, mas as perdedoras também pagam fees
+CONCURRENT_SELL = False
+SELL_BURST_FEE_MULTIPLIERS = (1.0, 1.5, 2.0)
+
+async def sell_burst(trader, fee_multipliers):
+    """
+    Executa trader.execute_sell para cada multiplicador de fee ao mesmo tempo e retorna a
+    primeira assinatura não rejeitada (ou None se todas falharem); as demais são canceladas.
+    """
+    tasks = [asyncio.create_task(trader.execute_sell(fee_multiplier=m)) for m in fee_multipliers]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                signature = await next_done
+            except Exception as e:
+                logging.warning("Variante de venda falhou: %s", e)
+                continue
+            if signature:
+                return signature
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# Espera entre tentativas de venda: 0.25s, 0.5s, 1s, 2s (teto), com jitter
+SELL_RETRY_BASE_DELAY = 0.25
+SELL_RETRY_MAX_DELAY = 2.0
+
+def sell_retry_delay(attempt: int) -> float:
+    """Backoff exponencial com jitter (50% a 100% do intervalo) para a tentativa informada."""
+    delay = min(SELL_RETRY_BASE_DELAY * (2 ** attempt), SELL_RETRY_MAX_DELAY)
+    return delay * (0.5 + random.random() / 2)
+
+# Corpo JSON-RPC de getTransaction (commitment "confirmed") pré-serializado; só a assinatura varia
+_GETTX_CONFIRMED_PREFIX = b'{"jsonrpc":"2.0","id":1,"method":"getTransaction","params":["'
+_GETTX_CONFIRMED_SUFFIX = b'",{"commitment":"confirmed","encoding":"json"}]}'
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Prazo e backoff da consulta HTTP usada quando a notificação do WebSocket não chega
+SELL_STATUS_TIMEOUT = 20.0
+SELL_STATUS_MAX_DELAY = 2.0
+
+async def check_sell_tx(signature: str) -> str:
+    """
+    Consulta getTransaction uma vez e classifica o resultado a partir de meta.err.
+
+    :return: "ok", "illegal_owner", "failed" ou "pending" (transação ainda não visível
+             ou falha na consulta)
+    """
+    # Assinaturas são base58, então podem ser inseridas no template sem escape
+    body = _GETTX_CONFIRMED_PREFIX + signature.encode() + _GETTX_CONFIRMED_SUFFIX
+    try:
+        response = await get_rpc_client().post(HELIUS_RPC_URL, content=body, headers=JSON_HEADERS)
+        result = orjson.loads(response.content).get("result")
+    except Exception as e:
+        logging.warning("Erro ao consultar a transação %s: %s", signature, e)
+        return "pending"
+    
+    meta = result.get("meta") if result else None
+    if meta is None:
+        return "pending"
+    err = meta.get("err")
+    if err is None:
+        return "ok"
+    print(format_error(f"Erro na transação detectado: {err}"))
+    if fatal_instruction_error(err) == "IllegalOwner":
+        print(format_error("Erro de IllegalOwner detectado. A venda falhou."))
+        return "illegal_owner"
+    return "failed"
+
+async def confirm_sell(signature: str) -> bool:
+    """
+    Confirma a transação de venda (commitment "confirmed"): primeiro pela notificação do
+    WebSocket e, se ela não chegar, por check_sell_tx com backoff exponencial até
+    SELL_STATUS_TIMEOUT.
+    """
+    if not HELIUS_API_KEY:
+        # Sem API key (já avisado na inicialização), tentamos verificar com a função básica
+        return await verify_transaction_status(signature, max_attempts=10, sleep_time=2)
+    
+    confirmed = await wait_signature_notification(signature)
+    if confirmed is not None:
+        return confirmed
+    
+    # Verificar o status da transação de forma mais detalhada
+    print(format_info("Consultando status detalhado da transação..."))
+    deadline = time.monotonic() + SELL_STATUS_TIMEOUT
+    delay = 0.25
+    while True:
+        status = await check_sell_tx(signature)
+        if status != "pending":
+            return status == "ok"
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, SELL_STATUS_MAX_DELAY)
+
+async def monitor_profit(pool_config, buy_price, monitor, deadline):
+    """
+    :param monitor: O mesmo PriceMonitorGRPC usado em monitor_pool: a subscrição da pool
+                    continua aberta, sem novo subscribe após a compra.
+    :param deadline: Instante (time.monotonic) em que o monitoramento termina sem atingir a meta;
+                     nesse caso retorna pool_config com o último preço para a venda.
+    """
+    pool_config["reference_price"] = pool_config["current_price"] = buy_price
     pool_name = pool_config['token_pair']
+    pool_prefix = format_pool(pool_name)  # prefixo colorido montado uma única vez
     target = pool_config.get("profit_target_percentage", 5)
     
     # Obtém o timeout em minutos para exibir informação
     timeout_minutes = pool_config.get("profit_timeout_minutes", 5)
     
-    print(f"\n{format_header(' MONITORANDO LUCRO ')} {format_pool(pool_name)}")
-    print(f"  Preço de compra: {format_price(buy_price)} | Meta de lucro: {format_percent(target, True)} | Timeout: {timeout_minutes} minutos")
+    console.emit(f"\n{format_header(' MONITORANDO LUCRO ')} {pool_prefix}")
+    console.emit(f"  Preço de compra: {format_price(buy_price)} | Meta de lucro: {format_percent(target, True)} | Timeout: {timeout_minutes} minutos")
     
     last_print_time = 0
     print_interval = 5  # segundos
+    reference_price = buy_price
+    last_profit = pool_config.get("last_profit", 0)
     
-    async with monitor as m:
+    # Um único gerador de preços consumido em segundo plano; o loop abaixo lê sempre o
+    # preço mais recente (cancelar a espera na fila não fecha o gerador)
+    price_queue = asyncio.Queue()
+
+    async def consume_prices():
+        async for new_price in monitor.stream_price():
+            price_queue.put_nowait(new_price)
+
+    consumer = asyncio.create_task(consume_prices())
+    try:
         last_warning_time = 0
         warning_interval = 15  # Intervalo em segundos para exibir mensagens de aviso
         while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                console.emit(format_warning(f"{timeout_minutes} minutos se passaram sem atingir a meta de lucro; executando venda com o preço atual"), flush=True)
+                return pool_config
             try:
-                price = await asyncio.wait_for(m.stream_price().__anext__(), timeout=5)
+                price = await asyncio.wait_for(price_queue.get(), timeout=min(5, remaining))
+                while not price_queue.empty():
+                    price = price_queue.get_nowait()
             except asyncio.TimeoutError:
-                price = pool_config.get("reference_price", buy_price)
-                print(f"{format_pool(pool_name)} {format_warning('Sem atualização via gRPC')} | Usando preço de referência: {format_price(price)}")
+                if consumer.done():
+                    # Stream de preços encerrada: sem preços não há como acompanhar a meta; vende
+                    # agora e o próximo ciclo leva o erro ao central_manager (reconexão)
+                    logging.error("Stream de preços de %s encerrada durante o monitoramento de lucro: %s",
+                                  pool_name, consumer.exception())
+                    console.emit(format_warning("Stream de preços encerrada; executando venda com o último preço"), flush=True)
+                    return pool_config
+                if time.monotonic() >= deadline:
+                    continue
+                # Pool parada (stream_price só emite variações acima de price_yield_threshold):
+                # segue com o preço de referência sem aviso no console
+                price = reference_price
+                logging.debug("Sem novo preço de %s; usando preço de referência %.10f", pool_name, price)
             
             profit = ((price - buy_price) / buy_price) * 100
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Imprime a cada X segundos ou em mudanças de lucro significativas
-            if current_time - last_print_time >= print_interval or abs(profit - pool_config.get("last_profit", 0)) >= 0.5:
-                print(f"{format_pool(pool_name)} Preço atual: {format_price(price)} | Lucro: {format_percent(profit)}")
-                pool_config["last_profit"] = profit
+            if current_time - last_print_time >= print_interval or abs(profit - last_profit) >= 0.5:
+                console.emit(f"{pool_prefix} Preço atual: {format_price(price)} | Lucro: {format_percent(profit)}")
+                pool_config["last_profit"] = last_profit = profit
                 last_print_time = current_time
             
-            pool_config["reference_price"] = price
-            pool_config["current_price"] = price
+            # current_price é lido pelo central_manager após o timeout; só regrava se mudou
+            if price != reference_price:
+                pool_config["reference_price"] = pool_config["current_price"] = reference_price = price
             
             if profit >= target:
-                print(f"\n{format_pool(pool_name)} {Fore.BLACK}{Back.GREEN} META DE LUCRO ATINGIDA {Style.RESET_ALL} {format_percent(profit)}")
-                print(f"  Preço de compra: {format_price(buy_price)} | Preço atual: {format_price(price)}")
+                console.emit(f"\n{pool_prefix} {BLACK}{BG_GREEN} META DE LUCRO ATINGIDA {RESET} {format_percent(profit)}")
+                console.emit(f"  Preço de compra: {format_price(buy_price)} | Preço atual: {format_price(price)}", flush=True)
                 return pool_config
             else:
                 # Exibe mensagem de meta não atingida apenas a cada intervalo definido
                 if current_time - last_warning_time >= warning_interval:
-                    print(format_warning(f"Aguardando meta de lucro: {format_percent(profit)} (alvo: {format_percent(target)})"))
+                    console.emit(format_warning(f"Aguardando meta de lucro: {format_percent(profit)} (alvo: {format_percent(target)})"))
                     last_warning_time = current_time
-                await asyncio.sleep(1)
+                await asyncio.sleep(min(1, max(0, deadline - time.monotonic())))
+    finally:
+        # Aguarda o fim do consumidor para que o gerador de preços seja fechado aqui; um erro
+        # da stream já foi registrado acima e volta ao central_manager no próximo ciclo
+        consumer.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await consumer
+
+@dataclass(slots=True)
+class DailyStats:
+    """Contadores do dia para o resumo diário do Telegram."""
+    trades: int = 0
+    profit: float = 0.0
+
+    def as_dict(self):
+        """Formato esperado por TelegramNotifier.send_daily_summary."""
+        return {"daily_trades": self.trades, "daily_profit": self.profit}
 
 async def central_manager():
+    # Python 3.12+: tarefas começam a executar de forma síncrona até a primeira suspensão real,
+    # evitando uma ida ao scheduler para cada create_task (monitores e subscrições gRPC)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     trade_config = load_trade_config()
     
     # Inicializa o notificador Telegram
     telegram = TelegramNotifier()
     
     # Configuração para resumo periódico
-    last_summary_time = time.time()
+    last_summary_time = time.monotonic()
     summary_interval = 6 * 3600  # 6 horas em segundos
     
     # Configuração para resumo diário
     last_daily_summary = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    daily_stats = {"daily_trades": 0, "daily_profit": 0}
+    daily_stats = DailyStats()
     
     # Verificar se a chave de API do Helius está configurada
-    helius_api_key = os.getenv("HELIUS_API_KEY", "")
-    
-    if not helius_api_key:
+    if not HELIUS_API_KEY:
         print("⚠️ ATENÇÃO: API Key do Helius não está configurada no arquivo .env")
-        await telegram.send_error_notification(
+        notify(telegram.send_error_notification(
             "API Key do Helius não está configurada no arquivo .env. O monitoramento de transações pode ser afetado.",
             error_type="Configuração",
             suggestions=[
                 "Adicione HELIUS_API_KEY no arquivo .env",
                 "Obtenha uma API key gratuita em https://dev.helius.xyz/dashboard"
             ]
-        )
+        ))
     
     # Log de configurações
     print("\n" + format_header(" CONFIGURAÇÕES DO BOT ").center(80))
@@ -471,31 +845,48 @@ async def central_manager():
     print(f"  • Priority Fee: {format_sol(priority_fee_sol)} ({priority_fee_lamports:,} lamports)")
     print(f"  • Compute Price: {format_sol(compute_price_sol)} ({compute_price_lamports:,} lamports)")
     
-    print(f"\n  • API Helius: {Fore.GREEN + 'Configurada ✅' if helius_api_key else Fore.RED + 'Não configurada ❌'}")
+    print(f"\n  • API Helius: {GREEN + 'Configurada ✅' if HELIUS_API_KEY else RED + 'Não configurada ❌'}")
     print("\n" + "=" * 80)
     
     # Inicializa a lista de pools para monitoramento
     pool_configs = []
     
+    # Limita quantos monitores estabelecem conexão gRPC simultaneamente
+    max_concurrent_monitors = trade_config.get("max_concurrent_monitors", 16)
+    monitor_slots = asyncio.Semaphore(max_concurrent_monitors)
+    
     # Obtém a lista de tokens a serem monitorados a partir do config.json
     tokens_to_monitor = trade_config.get("tokens_to_monitor", [])
     if not tokens_to_monitor:
         print(format_error("Nenhum token configurado para monitoramento. Adicione tokens em 'tokens_to_monitor' no config.json"))
-        await telegram.send_error_notification("Nenhum token configurado para monitoramento em config.json. O bot não pode operar sem tokens para monitorar.")
+        notify(telegram.send_error_notification("Nenhum token configurado para monitoramento em config.json. O bot não pode operar sem tokens para monitorar."))
         return
     
     print(f"\n{format_header(f' CARREGANDO INFORMAÇÕES DE {len(tokens_to_monitor)} TOKENS ')}")
     
-    # Processa cada token configurado
+    # Processa os tokens configurados em paralelo (limitado pelo mesmo semáforo dos monitores)
+    valid_tokens = []
     for token_config in tokens_to_monitor:
         if not token_config.get("out_token"):
             print(format_warning(f"Token ignorado: 'out_token' não definido: {token_config}"))
             continue
-        
+        valid_tokens.append(token_config)
+    
+    async def build_limited(token_config):
+        async with monitor_slots:
+            return await build_pool_config_from_token(token_config, trade_config)
+    
+    # Obtém informações das pools via API da Raydium
+    results = await asyncio.gather(
+        *(build_limited(token_config) for token_config in valid_tokens),
+        return_exceptions=True
+    )
+    
+    for token_config, config in zip(valid_tokens, results):
         token_mint = token_config.get("out_token")
-        
-        # Obtém informações da pool via API da Raydium
-        config = await build_pool_config_from_token(token_config, trade_config)
+        if isinstance(config, Exception):
+            logging.error("Erro ao configurar a pool do token %s: %s", token_mint, config)
+            config = None
         if config:
             pool_configs.append(config)
             print(format_success(f"Pool configurada: {format_pool(config['token_pair'])} | Reserva: {format_sol(config.get('sol_reserve', 0))}"))
@@ -506,7 +897,7 @@ async def central_manager():
     if not pool_configs:
         error_msg = "Nenhuma pool válida para monitorar. Verifique a configuração dos tokens e a conectividade com a API."
         print(format_error(error_msg + " Reiniciando..."))
-        await telegram.send_error_notification(error_msg)
+        notify(telegram.send_error_notification(error_msg))
         await asyncio.sleep(10)
         return
         
@@ -525,32 +916,43 @@ async def central_manager():
         logging.info("Monitorando pool: %s | Endereço: %s", cfg['token_pair'], cfg['pair_address'])
 
     # Notifica o início do bot via Telegram
-    await telegram.send_bot_status(
+    notify(telegram.send_bot_status(
         'iniciado',
         len(pool_configs),
         sorted_pools[:5],  # Envia as 5 maiores pools
         trade_config       # Envia as configurações de trading
-    )
+    ))
 
+    reconnect_attempt = 0
     while True:
         try:
-            async with http() as p:
+            async with http() as p, AsyncExitStack() as monitor_stack:
                 from bxsolana import trader_api
                 api = await trader_api(p)
+                
+                # Um PriceMonitorGRPC persistente por pool: a mesma subscrição atende a
+                # detecção de queda e o monitoramento de lucro, entre ciclos
+                monitors = {}
+                for cfg in pool_configs:
+                    monitors[cfg["pair_address"]] = await monitor_stack.enter_async_context(
+                        PriceMonitorGRPC(cfg, GRPC_RPC_FQDN, GRPC_X_TOKEN)
+                    )
+                # Conexão estabelecida: a próxima falha recomeça o backoff do início
+                reconnect_attempt = 0
                 # Log apenas para arquivo, não exibir no console
                 logging.info("Bot Multi-Pool iniciado!")
                 print(format_header(" BOT INICIADO E PRONTO PARA OPERAR ").center(80))
                 while True:
                     # Envia um resumo periódico do monitoramento
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     current_datetime = datetime.now()
                     
                     # Verificar se é hora de enviar resumo diário (a cada 24h às 00:00)
                     if current_datetime.day != last_daily_summary.day:
-                        await telegram.send_daily_summary(pool_configs, daily_stats)
+                        notify(telegram.send_daily_summary(pool_configs, daily_stats.as_dict()))
                         last_daily_summary = current_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
                         # Resetar estatísticas diárias
-                        daily_stats = {"daily_trades": 0, "daily_profit": 0}
+                        daily_stats = DailyStats()
                     
                     # Enviar resumo periódico
                     if current_time - last_summary_time >= summary_interval:
@@ -561,24 +963,36 @@ async def central_manager():
                             }
                             for cfg in pool_configs
                         ]
-                        # Ordena por reserva de SOL
-                        active_pools.sort(key=lambda x: x['sol_reserve'], reverse=True)
+                        # send_bot_status seleciona as maiores pools por reserva de SOL
                         
-                        await telegram.send_bot_status(
+                        notify(telegram.send_bot_status(
                             'monitorando',
                             len(pool_configs),
                             active_pools,
                             trade_config
-                        )
+                        ))
                         last_summary_time = current_time
                     
-                    tasks = [asyncio.create_task(monitor_pool(config)) for config in pool_configs]
+                    task_to_cfg = {
+                        asyncio.create_task(monitor_pool(config, monitors[config["pair_address"]], telegram, monitor_slots)): config
+                        for config in pool_configs
+                    }
                     print(format_info(f"Monitorando {len(pool_configs)} pools simultaneamente..."))
-                    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    # Cabeçalho com hora atual a cada 5 minutos enquanto as pools são monitoradas
+                    cancel_header = schedule_monitoring_header(300)
+                    done, pending = await asyncio.wait(task_to_cfg, return_when=asyncio.FIRST_COMPLETED)
+                    cancel_header()
                     for t in pending:
                         t.cancel()
+                    # Aguarda o cancelamento terminar antes de reutilizar os monitores das pools
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    console.flush()
                     selected_config = None
                     for task in done:
+                        exc = task.exception()
+                        if exc is not None:
+                            logging.error("Erro no monitoramento da pool %s: %s", task_to_cfg[task]['token_pair'], exc)
+                            raise exc
                         result = task.result()
                         if result is not None:
                             selected_config = result
@@ -587,8 +1001,23 @@ async def central_manager():
                         print(format_warning("Nenhuma pool disparou a condição. Reiniciando ciclo..."))
                         continue
                     
+                    # Valores fixos durante o trade, lidos uma única vez
+                    token_pair = selected_config['token_pair']
+                    token_name = selected_config['base_token']
+                    drop_timestamp = selected_config.get("drop_timestamp", 0)
+                    drop_monotonic = selected_config["drop_monotonic"]
+                    # Argumentos comuns às notificações de compra e venda (mesmo snapshot da pool)
+                    trade_context = {
+                        "pool_name": token_pair,
+                        "pool_data": {
+                            "tvl": selected_config.get("tvl", 0),
+                            "volume_24h": selected_config.get("volume_24h", 0),
+                            "sol_reserve": selected_config.get("sol_reserve", 0)
+                        }
+                    }
+                    
                     print("\n" + "=" * 80)
-                    print(format_header(f" EXECUTANDO TRADE PARA {selected_config['token_pair']} ").center(80))
+                    print(format_header(f" EXECUTANDO TRADE PARA {token_pair} ").center(80))
                     print("=" * 80)
                     
                     # Adiciona as configurações de compra e venda ao selected_config
@@ -599,43 +1028,42 @@ async def central_manager():
                     print(format_info("Iniciando operação de compra..."))
                     buy_sig = await trader.execute_buy()
                     if buy_sig:
-                        print(format_success(f"COMPRA executada para {selected_config['token_pair']} (tx: {Fore.CYAN}{buy_sig}{Style.RESET_ALL})"))
-                        print(f"  • Verificar em: {Fore.CYAN}https://solscan.io/tx/{buy_sig}{Style.RESET_ALL}")
+                        print(format_success(f"COMPRA executada para {token_pair} (tx: {CYAN}{buy_sig}{RESET})"))
+                        print(f"  • Verificar em: {CYAN}https://solscan.io/tx/{buy_sig}{RESET}")
                         # Log para arquivo
                         logging.info("COMPRA executada para %s, assinatura: %s", 
-                                    selected_config['token_pair'], buy_sig)
+                                    token_pair, buy_sig)
                         selected_config["buy_signature"] = buy_sig
                         
                         # Iniciar a obtenção do timestamp em uma tarefa separada para não bloquear o fluxo
-                        async def get_blockchain_timestamp():
-                            helius_api_key = os.getenv("HELIUS_API_KEY", "")
-                            if helius_api_key:
+                        # Recebe os valores do trade por parâmetro: a tarefa pode terminar depois que o
+                        # ciclo seguinte já rebindou selected_config/buy_sig
+                        async def get_blockchain_timestamp(config, signature, drop_ts):
+                            if HELIUS_API_KEY:
                                 print(format_info("Obtendo timestamp da blockchain em segundo plano..."))
-                                tx_time = await get_transaction_time(buy_sig, helius_api_key)
+                                try:
+                                    tx_time = await get_transaction_time(signature)
+                                except Exception as e:
+                                    logging.warning("Erro ao obter o timestamp da transação %s: %s", signature, e)
+                                    return
                                 if tx_time > 0:
-                                    drop_time = selected_config.get("drop_timestamp", 0)
-                                    blockchain_execution_time = tx_time - int(drop_time)
-                                    selected_config["blockchain_execution_time"] = blockchain_execution_time
+                                    blockchain_execution_time = tx_time - int(drop_ts)
+                                    config["blockchain_execution_time"] = blockchain_execution_time
                                     print(format_info(f"✓ Timestamp da blockchain obtido com sucesso"))
                             return
                         
                         # Executa a obtenção do timestamp em segundo plano sem bloquear o fluxo principal
-                        timestamp_task = asyncio.create_task(get_blockchain_timestamp())
+                        spawn_background(get_blockchain_timestamp(selected_config, buy_sig, drop_timestamp))
                         
                         # Envia notificação de compra para o Telegram (sem incluir o tempo de execução)
-                        await telegram.send_trade_notification(
+                        notify(telegram.send_trade_notification(
                             "COMPRA", 
-                            selected_config['token_pair'].split('/')[0], 
+                            token_name, 
                             selected_config.get('bought_amount', 0), 
                             selected_config.get('bought_price', 0),
-                            selected_config['token_pair'],
-                            buy_sig,  # Adiciona a assinatura da transação
-                            {
-                                "tvl": selected_config.get("tvl", 0),
-                                "volume_24h": selected_config.get("volume_24h", 0),
-                                "sol_reserve": selected_config.get("sol_reserve", 0)
-                            }
-                        )
+                            signature=buy_sig,  # Adiciona a assinatura da transação
+                            **trade_context
+                        ))
                         
                         # Usa o preço de compra registrado como referência para monitorar lucro
                         bought_price = selected_config.get("bought_price")
@@ -645,30 +1073,36 @@ async def central_manager():
                             print(format_warning("Preço de compra não registrado corretamente"))
                             continue
                             
-                        print(format_info(f"Compra: {format_sol(selected_config['trade_amount'])} por {format_price(bought_price)} | Quantidade: {Fore.WHITE}{bought_amount:,.6f} tokens"))
+                        print(format_info(f"Compra: {format_sol(selected_config['trade_amount'])} por {format_price(bought_price)} | Quantidade: {WHITE}{bought_amount:,.6f} tokens"))
 
+                        # Obtém o timeout em minutos do config.json ou usa 5 minutos como padrão
+                        timeout_minutes = trade_config.get("profit_timeout_minutes", 5)
+                        timeout_seconds = timeout_minutes * 60
+                        
+                        # Adiciona o timeout na configuração da pool para uso na função monitor_profit
+                        selected_config["profit_timeout_minutes"] = timeout_minutes
+                        
+                        print(format_info(f"Iniciando monitoramento de lucro (timeout: {timeout_minutes} minutos)..."))
+                        # Enquanto monitora o lucro, mantém a transação de venda pré-construída
+                        sell_tx_warmer = spawn_background(trader.keep_sell_tx_warm())
                         try:
-                            # Obtém o timeout em minutos do config.json ou usa 5 minutos como padrão
-                            timeout_minutes = trade_config.get("profit_timeout_minutes", 5)
-                            timeout_seconds = timeout_minutes * 60
-                            
-                            # Adiciona o timeout na configuração da pool para uso na função monitor_profit
-                            selected_config["profit_timeout_minutes"] = timeout_minutes
-                            
-                            print(format_info(f"Iniciando monitoramento de lucro (timeout: {timeout_minutes} minutos)..."))
-                            profit_config = await asyncio.wait_for(
-                                monitor_profit(selected_config, bought_price),
-                                timeout=timeout_seconds
+                            # O prazo é calculado uma vez; monitor_profit encerra sozinho ao atingi-lo
+                            profit_config = await monitor_profit(
+                                selected_config, bought_price, monitors[selected_config["pair_address"]],
+                                deadline=time.monotonic() + timeout_seconds
                             )
-                        except asyncio.TimeoutError:
-                            print(format_warning(f"{timeout_minutes} minutos se passaram sem atingir a meta de lucro; executando venda com o preço atual"))
-                            profit_config = selected_config
+                        finally:
+                            sell_tx_warmer.cancel()
+                        console.flush()
                         
                         if profit_config is not None:
                             # Executa o ciclo de venda
                             sell_sig = None
                             max_sell_attempts = 20
-                            await asyncio.sleep(2)
+                            concurrent_sell = sell_settings.get("concurrent_sell", CONCURRENT_SELL)
+                            sell_fee_multipliers = sell_settings.get("concurrent_sell_fee_multipliers", SELL_BURST_FEE_MULTIPLIERS)
+                            # Em vez de esperar 2s fixos, segue assim que o saldo comprado estiver visível
+                            await wait_balance_ready(selected_config["owner_address"], selected_config["out_token"], bought_amount)
                             
                             print(format_info("Iniciando operação de venda..."))
                             
@@ -676,124 +1110,66 @@ async def central_manager():
                                 if attempt > 0:
                                     print(format_warning(f"Tentativa {attempt+1}/{max_sell_attempts} de venda..."))
                                 
-                                sell_sig = await trader.execute_sell()
+                                if concurrent_sell:
+                                    sell_sig = await sell_burst(trader, sell_fee_multipliers)
+                                else:
+                                    sell_sig = await trader.execute_sell()
                                 if sell_sig:
-                                    print(format_success(f"VENDA executada para {selected_config['token_pair']} (tx: {Fore.CYAN}{sell_sig}{Style.RESET_ALL})"))
-                                    print(f"  • Verificar em: {Fore.CYAN}https://solscan.io/tx/{sell_sig}{Style.RESET_ALL}")
-                                    # Log para arquivo
-                                    logging.info("VENDA executada para %s, assinatura: %s", 
-                                                selected_config['token_pair'], sell_sig)
-                                    
-                                    # Confirmação adicional por api
+                                    # A venda só conta como executada com o commitment "confirmed"
                                     print(format_info("Verificando confirmação final da transação de venda..."))
-                                    helius_api_key = os.getenv("HELIUS_API_KEY", "")
-                                    tx_confirmed = False
-                                    
-                                    # Espere um pouco para garantir que a transação esteja confirmada
-                                    await asyncio.sleep(3)
-                                    
-                                    if helius_api_key:
-                                        # Verificar o status da transação de forma mais detalhada
-                                        print(format_info("Consultando status detalhado da transação..."))
-                                        
-                                        # Verificação explícita para erros de IllegalOwner
-                                        url = f"https://mainnet.helius-rpc.com/?api-key={helius_api_key}"
-                                        payload = {
-                                            "jsonrpc": "2.0",
-                                            "id": 1,
-                                            "method": "getTransaction",
-                                            "params": [sell_sig, {"commitment": "confirmed", "encoding": "json"}]
-                                        }
-                                        
-                                        # Consulta manual para verificar erros específicos
-                                        error_detected = False
-                                        async with aiohttp.ClientSession() as session:
-                                            async with session.post(url, json=payload) as response:
-                                                data = await response.json()
-                                                result = data.get("result")
-                                                
-                                                if result and result.get("meta"):
-                                                    meta = result.get("meta")
-                                                    if meta.get("err"):
-                                                        error_detected = True
-                                                        error_detail = str(meta.get("err"))
-                                                        print(format_error(f"Erro na transação detectado: {error_detail}"))
-                                                        
-                                                        if "IllegalOwner" in error_detail:
-                                                            print(format_error("Erro de IllegalOwner detectado. A venda falhou."))
-                                        
-                                        if error_detected:
-                                            tx_confirmed = False
-                                        else:
-                                            # Usar o verify_transaction_status para uma verificação padrão
-                                            tx_confirmed = await verify_transaction_status(sell_sig, max_attempts=10, sleep_time=2)
-                                    else:
-                                        print(format_warning("API Key do Helius não configurada. Não é possível verificar detalhes da transação."))
-                                        # Mesmo sem API key, tentamos verificar com a função básica
-                                        tx_confirmed = await verify_transaction_status(sell_sig, max_attempts=10, sleep_time=2)
+                                    tx_confirmed = await confirm_sell(sell_sig)
                                     
                                     if not tx_confirmed:
-                                        print(format_warning("Transação de venda enviada mas não foi possível confirmar seu sucesso."))
-                                        print(format_info("Tentando nova venda após 5 segundos..."))
-                                        await asyncio.sleep(5)
-                                        continue
+                                        # Sem confirmação observada a transação ainda pode ter entrado:
+                                        # sem saldo restante, não há o que vender de novo
+                                        remaining = await get_token_balance(
+                                            selected_config["owner_address"], selected_config["out_token"], ttl=0
+                                        )
+                                        if remaining is None or remaining > 0:
+                                            print(format_warning("Transação de venda enviada mas não foi possível confirmar seu sucesso."))
+                                            retry_delay = sell_retry_delay(attempt)
+                                            print(format_info(f"Tentando nova venda após {retry_delay:.2f} segundos..."))
+                                            await asyncio.sleep(retry_delay)
+                                            continue
+                                        logging.warning("Venda %s sem confirmação, mas o saldo do token já está zerado", sell_sig)
+                                    
+                                    print(format_success(f"VENDA executada para {token_pair} (tx: {CYAN}{sell_sig}{RESET})"))
+                                    print(f"  • Verificar em: {CYAN}https://solscan.io/tx/{sell_sig}{RESET}")
+                                    # Log para arquivo
+                                    logging.info("VENDA executada para %s, assinatura: %s", 
+                                                token_pair, sell_sig)
                                     
-                                    # Envia notificação de venda para o Telegram
-                                    await telegram.send_trade_notification(
+                                    # Notificação de venda em segundo plano, sobrepondo-se ao cálculo e à exibição do resultado
+                                    notify(telegram.send_trade_notification(
                                         "VENDA", 
-                                        selected_config['token_pair'].split('/')[0], 
+                                        token_name, 
                                         bought_amount, 
                                         profit_config.get('current_price', bought_price),
-                                        selected_config['token_pair'],
-                                        sell_sig,  # Adiciona a assinatura da transação
-                                        {
-                                            "tvl": selected_config.get("tvl", 0),
-                                            "volume_24h": selected_config.get("volume_24h", 0),
-                                            "sol_reserve": selected_config.get("sol_reserve", 0)
-                                        }
-                                    )
+                                        signature=sell_sig,  # Adiciona a assinatura da transação
+                                        **trade_context
+                                    ))
                                     
-                                    # Calcula lucro
-                                    bought_price = selected_config.get('bought_price', 0)
-                                    bought_amount = selected_config.get('bought_amount', 0)
+                                    # Calcula lucro (bought_price/bought_amount já lidos após a compra)
                                     current_price = profit_config.get('current_price', bought_price)
-                                    profit_percentage = ((current_price - bought_price) / bought_price) * 100 if bought_price > 0 else 0
-                                    profit_amount = (current_price - bought_price) * bought_amount if bought_price > 0 and bought_amount > 0 else 0
+                                    price_delta = current_price - bought_price
+                                    if bought_price > 0:
+                                        profit_percentage = price_delta / bought_price * 100
+                                        profit_amount = price_delta * bought_amount if bought_amount > 0 else 0
+                                    else:
+                                        profit_percentage = profit_amount = 0
                                     
                                     # Atualiza estatísticas diárias
-                                    daily_stats["daily_trades"] += 1
-                                    daily_stats["daily_profit"] += profit_amount
-
-                                    # Exibe resultado do trade
-                                    print("\n" + format_header(" RESULTADO DO TRADE ").center(80))
-                                    print(f"  • Token: {Fore.YELLOW}{selected_config['token_pair'].split('/')[0]}{Style.RESET_ALL}")
-                                    print(f"  • Quantidade: {Fore.WHITE}{bought_amount:,.4f} tokens{Style.RESET_ALL}")
-                                    print(f"  • Preço de compra: {format_price(bought_price)}")
-                                    print(f"  • Preço de venda: {format_price(current_price)}")
-                                    print(f"  • Lucro percentual: {format_percent(profit_percentage)}")
-                                    print(f"  • Lucro em SOL: {format_sol(profit_amount)}")
+                                    daily_stats.trades += 1
+                                    daily_stats.profit += profit_amount
                                     
-                                    # Exibe tempo de execução
-                                    start_time_str = datetime.fromtimestamp(selected_config.get("drop_timestamp", 0)).strftime("%H:%M:%S.%f")[:-3]
-                                    end_time_str = datetime.now().strftime("%H:%M:%S")
-                                    time_elapsed = time.time() - selected_config.get("drop_timestamp", 0)
-                                    print("\n" + format_subheader(" TEMPO DE EXECUÇÃO ").center(80))
-                                    print(f"  • Detecção da queda: {Fore.CYAN}{start_time_str}{Style.RESET_ALL}")
-                                    print(f"  • Finalização: {Fore.CYAN}{end_time_str}{Style.RESET_ALL}")
-                                    print(f"  • Tempo total (ciclo completo): {Fore.GREEN if time_elapsed > 0 else Fore.RED}{time_elapsed:.2f} segundos{Style.RESET_ALL}")
-                                    
-                                    # Exibe tempos detalhados de execução se disponíveis
-                                    if "submit_time" in selected_config:
-                                        submit_time = selected_config["submit_time"]
-                                        print(f"  • Tempo até envio da transação: {Fore.YELLOW}{submit_time:.2f} segundos{Style.RESET_ALL}")
-                                    
-                                    if "blockchain_execution_time" in selected_config:
-                                        blockchain_time = selected_config["blockchain_execution_time"]
-                                        print(f"  • Tempo de execução da compra: {Fore.CYAN}{blockchain_time} segundos{Style.RESET_ALL}")
+                                    # Tempo de execução
+                                    drop_dt = datetime.fromtimestamp(drop_timestamp)
+                                    end_dt = datetime.now()
+                                    start_time_str = f"{drop_dt.hour:02d}:{drop_dt.minute:02d}:{drop_dt.second:02d}.{drop_dt.microsecond // 1000:03d}"
+                                    end_time_str = f"{end_dt.hour:02d}:{end_dt.minute:02d}:{end_dt.second:02d}"
+                                    time_elapsed = time.monotonic() - drop_monotonic
                                     
                                     # Envio de notificação de lucro
-                                    token_name = selected_config['token_pair'].split('/')[0]
-                                    
                                     # Prepara dados adicionais incluindo o tempo de execução da compra
                                     trade_data = {
                                         "quantity": bought_amount
@@ -807,7 +1183,8 @@ async def central_manager():
                                     if "blockchain_execution_time" in selected_config:
                                         trade_data["buy_execution_time"] = selected_config["blockchain_execution_time"]
                                     
-                                    await telegram.send_profit_notification(
+                                    # Agendada antes da exibição do resultado no terminal
+                                    notify(telegram.send_profit_notification(
                                         token_name,
                                         profit_percentage,
                                         profit_amount,
@@ -815,35 +1192,62 @@ async def central_manager():
                                         sell_price=current_price,
                                         time_elapsed=time_elapsed,
                                         trade_data=trade_data
-                                    )
+                                    ))
+
+                                    # Exibe resultado e tempo de execução do trade em uma única escrita
+                                    report = [
+                                        "\n" + format_header(" RESULTADO DO TRADE ").center(80),
+                                        f"  • Token: {YELLOW}{token_name}{RESET}",
+                                        f"  • Quantidade: {WHITE}{bought_amount:,.4f} tokens{RESET}",
+                                        f"  • Preço de compra: {format_price(bought_price)}",
+                                        f"  • Preço de venda: {format_price(current_price)}",
+                                        f"  • Lucro percentual: {format_percent(profit_percentage)}",
+                                        f"  • Lucro em SOL: {format_sol(profit_amount)}",
+                                        "\n" + format_subheader(" TEMPO DE EXECUÇÃO ").center(80),
+                                        f"  • Detecção da queda: {CYAN}{start_time_str}{RESET}",
+                                        f"  • Finalização: {CYAN}{end_time_str}{RESET}",
+                                        f"  • Tempo total (ciclo completo): {GREEN}{time_elapsed:.2f} segundos{RESET}",
+                                    ]
+                                    
+                                    # Tempos detalhados de execução, se disponíveis
+                                    if "submit_time" in trade_data:
+                                        report.append(f"  • Tempo até envio da transação: {YELLOW}{trade_data['submit_time']:.2f} segundos{RESET}")
+                                    if "buy_execution_time" in trade_data:
+                                        report.append(f"  • Tempo de execução da compra: {CYAN}{trade_data['buy_execution_time']} segundos{RESET}")
+                                    print("\n".join(report))
                                     
                                     break
+                                elif attempt + 1 < max_sell_attempts:
+                                    await asyncio.sleep(sell_retry_delay(attempt))
                             else:
                                 # Esse bloco é executado se o loop terminar sem um break (ou seja, todas as tentativas falharam)
                                 print(format_error(f"Todas as {max_sell_attempts} tentativas de venda falharam."))
                                 # Enviar notificação de erro para o Telegram
-                                await telegram.send_error_notification(
-                                    f"Falha na venda de {selected_config['token_pair'].split('/')[0]} após {max_sell_attempts} tentativas",
+                                notify(telegram.send_error_notification(
+                                    f"Falha na venda de {token_name} após {max_sell_attempts} tentativas",
                                     error_type="Transação",
                                     suggestions=[
                                         "Verificar saldo do token",
                                         "Verificar conexão com a rede Solana",
                                         "Verificar se a pool ainda está ativa"
                                     ]
-                                )
+                                ))
                     else:
-                        print(format_error(f"COMPRA falhou para {selected_config['token_pair']}"))
+                        print(format_error(f"COMPRA falhou para {token_pair}"))
                         await asyncio.sleep(1)
                     
                     print("\n" + format_header(" REINICIANDO CICLO DE MONITORAMENTO ").center(80))
                     await asyncio.sleep(1)
         except Exception as e:
-            error_traceback = traceback.format_exc()
-            logging.error("Erro na conexão gRPC: %s. Tentando reconectar em 5 segundos...\n%s", e, error_traceback)
-            print(format_error(f"Erro na conexão gRPC: {e}\nTentando reconectar em 5 segundos..."))
+            # Backoff exponencial com jitter: ~0.5s, 1s, 2s, ... até 60s
+            reconnect_delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * (2 ** reconnect_attempt)) * random.uniform(0.75, 1.25)
+            reconnect_attempt += 1
+            # exc_info: o traceback é formatado no thread do QueueListener, não no event loop
+            logging.error("Erro na conexão gRPC: %s. Tentando reconectar em %.1f segundos...", e, reconnect_delay, exc_info=True)
+            print(format_error(f"Erro na conexão gRPC: {e}\nTentando reconectar em {reconnect_delay:.1f} segundos..."))
             
             # Envia notificação de erro com mais detalhes
-            await telegram.send_error_notification(
+            notify(telegram.send_error_notification(
                 f"Erro na conexão gRPC: {str(e)}",
                 error_type="Conexão",
                 suggestions=[
@@ -851,31 +1255,57 @@ async def central_manager():
                     "Verifique se as credenciais de API estão corretas",
                     "Aguarde alguns minutos e tente novamente"
                 ]
-            )
+            ))
             
-            await asyncio.sleep(5)
+            await asyncio.sleep(reconnect_delay)
+
+async def main():
+    if HELIUS_RPC_URL:
+        # Mantém as conexões com o Helius aquecidas entre trades
+        spawn_background(keep_rpc_warm(HELIUS_RPC_URL))
+    try:
+        await central_manager()
+    finally:
+        console.flush()
+        # Entrega as notificações ainda pendentes antes de encerrar a sessão HTTP e o cliente RPC
+        await cancel_background_tasks()
+        await drain_notifications()
+        await close_session()
+
+async def send_final_notification(coro):
+    """Envia uma notificação fora do loop principal (encerramento) e fecha a sessão HTTP."""
+    try:
+        await coro
+    finally:
+        await close_session()
 
 if __name__ == "__main__":
     print("\n" + "=" * 80)
     print(format_header(" BOT DE TRADING RAYDIUM - MULTI-POOL ").center(80))
     print("=" * 80)
     print(format_info("Iniciando o bot..."))
+    # uvloop (libuv) como event loop quando disponível; no Windows segue o loop padrão
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     notifier = None
     try:
         # Inicializar o notificador fora do central_manager para podermos usá-lo nos tratamentos de erro
         notifier = TelegramNotifier()
-        asyncio.run(central_manager())
+        asyncio.run(main())
     except KeyboardInterrupt:
         print(format_warning("\nOperação interrompida pelo usuário. Encerrando..."))
         if notifier:
-            asyncio.run(notifier.send_bot_status('parado', None, None))
+            asyncio.run(send_final_notification(notifier.send_bot_status('parado', None, None)))
     except Exception as e:
         print(format_error(f"Erro fatal: {e}"))
         logging.exception("Erro fatal")
         if notifier:
             error_traceback = traceback.format_exc()
             error_message = f"{str(e)}\n\nDetalhes técnicos:\n{error_traceback[-300:]}"  # Últimos 300 caracteres do traceback
-            asyncio.run(notifier.send_error_notification(error_message))
+            asyncio.run(send_final_notification(notifier.send_error_notification(error_message)))
     finally:
         print(format_info("Bot encerrado."))
         print("=" * 80)
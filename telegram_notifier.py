@@ -1,8 +1,13 @@
 import os
 import logging
 import asyncio
-import requests
+import heapq
+import time
+import aiohttp
+import httpx
+import orjson
 from dotenv import load_dotenv
+from http_session import get_session, get_telegram_client, close_session
 from datetime import datetime, timedelta
 import json
 
@@ -19,6 +24,115 @@ load_dotenv()
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
+SOL_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
+SOL_PRICE_TTL = 60  # segundos
+# A cotação é opcional na mensagem: não deixa o CoinGecko segurar a notificação
+SOL_PRICE_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Agrupamento de mensagens: envios dentro da janela viram um único sendMessage
+BATCH_WINDOW = 0.2  # segundos
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+_BATCH_SEPARATOR = "\n\n──────\n\n"
+
+# Envio ao Telegram: timeouts curtos e novas tentativas com backoff exponencial
+# para falhas transitórias (conexão, timeout, 429 e 5xx)
+TELEGRAM_TIMEOUT = httpx.Timeout(8, connect=3, read=5)
+SEND_ATTEMPTS = 3
+SEND_RETRY_BASE_DELAY = 0.25  # segundos
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Alertas de preço idênticos dentro desta janela são enviados uma única vez
+PRICE_ALERT_DEDUP_TTL = 30  # segundos
+
+# Troca "." e "," numa única passada: 1,234.5678 -> 1.234,5678 (formato pt-BR)
+_PT_BR_NUMBER = str.maketrans({",": ".", ".": ","})
+
+# Modelos das notificações de trade e de lucro, preenchidos com str.format_map
+_TRADE_TEMPLATE = (
+    "{header}\n\n"
+    "• <b>Token:</b> {token}\n"
+    "• <b>Quantidade:</b> {amount} tokens\n"
+    "• <b>Preço:</b> {value_emoji} {price} SOL\n"
+    "• <b>Valor (SOL):</b> {sol_value:.6f} SOL{usd_value}\n"
+    "• <b>Data/Hora:</b> {now}"
+    "{execution_time_info}{pool_info}{tx_link}"
+)
+_TRADE_POOL_TEMPLATE = (
+    "\n\n📊 <b>DADOS DA POOL</b>\n"
+    "• <b>TVL:</b> {tvl:.2f} SOL\n"
+    "• <b>Reserva SOL:</b> {sol_reserve:.2f} SOL"
+)
+_PROFIT_TEMPLATE = (
+    "{header}\n\n"
+    "• <b>Token:</b> {token}\n"
+    "• <b>Resultado:</b> {result_emoji} {profit_pct}\n"
+    "• <b>Lucro (SOL):</b> {profit_sol} SOL{usd_value}{quantity_info}\n"
+    "• <b>Data/Hora:</b> {now}"
+    "{prices}"
+)
+_PROFIT_PRICES_TEMPLATE = (
+    "\n\n📊 <b>DETALHES DA OPERAÇÃO</b>\n"
+    "• <b>Preço de compra:</b> {buy_price} SOL\n"
+    "• <b>Preço de venda:</b> {sell_price} SOL"
+)
+
+# Cabeçalhos das notificações de trade: (cabeçalho, emoji do preço)
+_TRADE_HEADERS = {
+    "COMPRA": ("🟢 <b>COMPRA REALIZADA</b> 🟢", "💸"),
+    "VENDA": ("🔴 <b>VENDA REALIZADA</b> 🔴", "💰")
+}
+
+# Cabeçalhos das notificações de lucro, indexados por (lucro > 0): (cabeçalho, emoji do resultado)
+_PROFIT_HEADERS = {
+    True: ("💎 <b>LUCRO REALIZADO</b> 💎", "📈"),
+    False: ("📉 <b>PREJUÍZO REGISTRADO</b> 📉", "⚠️")
+}
+
+# Rodapé fixo de send_bot_status
+_SYSTEM_INFO_BLOCK = (
+    "\n\n💻 <b>INFORMAÇÕES DO SISTEMA</b>\n"
+    "• <b>Versão:</b> Bot Multi-Pool GRPC v1.1.0\n"
+    "• <b>Rede:</b> Solana Mainnet\n"
+    "• <b>Provider:</b> Helius GRPC"
+)
+
+# Emoji por tipo de erro (send_error_notification)
+_ERROR_EMOJI = {
+    "API": "🔌",
+    "Blockchain": "⛓️",
+    "Configuração": "⚙️",
+    "Conexão": "📡",
+    "Transação": "💸",
+    "Geral": "⚠️"
+}
+
+# Cabeçalho por status do bot (send_bot_status)
+_STATUS_HEADER = {
+    "iniciado": "🚀 <b>BOT DE TRADING INICIADO</b> 🚀",
+    "parado": "🛑 <b>BOT DE TRADING PARADO</b> 🛑",
+    "monitorando": "👁️ <b>BOT EM MONITORAMENTO ATIVO</b> 👁️"
+}
+
+def _top_pools(pools_info, n):
+    """
+    Em uma única passada, soma a reserva de SOL de todas as pools e seleciona as n
+    maiores (heap de tamanho n). Empates mantêm a ordem original da lista.
+
+    :return: (reserva total, lista das n maiores pools em ordem decrescente)
+    """
+    total = 0.0
+    heap = []
+    for i, pool in enumerate(pools_info):
+        reserve = pool.get('sol_reserve', 0)
+        total += reserve
+        entry = (reserve, -i, pool)
+        if len(heap) < n:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    heap.sort(key=lambda entry: entry[:2], reverse=True)
+    return total, [pool for _, _, pool in heap]
+
 
 class TelegramNotifier:
     def __init__(self, token=None, chat_id=None):
@@ -41,22 +155,59 @@ class TelegramNotifier:
         self.trades_count = {"compras": 0, "vendas": 0}
         self.total_profit = 0.0
         self.successful_trades = 0
+
+        # Cache (timestamp monotônico, preço) da cotação SOL/USD
+        self._sol_price_cache = None
+        self._sol_price_lock = asyncio.Lock()
+
+        # Mensagens aguardando o próximo envio agrupado: (texto, parse_mode, future)
+        self._batch = []
+        self._batch_task = None
+
+        # Alertas de preço já enviados: hash da mensagem -> expiração (monotônica)
+        self._recent_alerts = {}
     
+    def _uptime_str(self, now):
+        """Tempo desde a inicialização do notificador, no formato H:MM:SS."""
+        h, rem = divmod(int((now - self.start_time).total_seconds()), 3600)
+        m, s = divmod(rem, 60)
+        return f"{h}:{m:02d}:{s:02d}"
+
     async def get_sol_price_usd(self):
-        """Obtém o preço atual do SOL em USD"""
+        """
+        Obtém o preço atual do SOL em USD.
+        A cotação fica em cache por SOL_PRICE_TTL segundos; notificações concorrentes
+        aguardam uma única consulta ao CoinGecko.
+        """
+        hit = self._sol_price_cache
+        if hit and time.monotonic() - hit[0] < SOL_PRICE_TTL:
+            return hit[1]
+        async with self._sol_price_lock:
+            hit = self._sol_price_cache
+            if hit and time.monotonic() - hit[0] < SOL_PRICE_TTL:
+                return hit[1]
+            price = await self._fetch_sol_price_usd()
+            if price:
+                self._sol_price_cache = (time.monotonic(), price)
+            return price
+
+    async def _fetch_sol_price_usd(self):
+        """Consulta o preço do SOL em USD no CoinGecko"""
         try:
-            url = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
-            async with requests.get(url) as response:
+            session = await get_session()
+            async with session.get(SOL_PRICE_URL, timeout=SOL_PRICE_TIMEOUT) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data.get("solana", {}).get("usd", 0)
         except Exception as e:
-            logger.error(f"Erro ao obter preço do SOL: {str(e)}")
+            logger.error("Erro ao obter preço do SOL: %s", e)
         return None  # Retorna None se não conseguir obter o preço
 
     async def send_message(self, message, parse_mode='HTML'):
         """
-        Envia uma mensagem para o chat configurado
+        Envia uma mensagem para o chat configurado.
+        Mensagens recebidas dentro de BATCH_WINDOW segundos são concatenadas (até o
+        limite de TELEGRAM_MAX_MESSAGE_LENGTH caracteres) e enviadas juntas.
         
         Args:
             message (str): Mensagem a ser enviada
@@ -68,24 +219,93 @@ class TelegramNotifier:
         if not self.enabled:
             logger.warning("Tentativa de enviar mensagem, mas o notificador está desativado.")
             return False
-            
+
+        future = asyncio.get_running_loop().create_future()
+        self._batch.append((message, parse_mode, future))
+        if self._batch_task is None:
+            self._batch_task = asyncio.create_task(self._flush_batch())
+        return await future
+
+    async def _flush_batch(self):
+        """Aguarda a janela de agrupamento e envia as mensagens acumuladas."""
+        batch = []
         try:
-            payload = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': parse_mode,
-                'disable_web_page_preview': True
-            }
-            
-            response = requests.post(self.api_url, json=payload)
-            response.raise_for_status()
-            
-            logger.info(f"Mensagem enviada com sucesso para o chat {self.chat_id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Erro ao enviar mensagem pelo Telegram: {e}")
-            return False
+            await asyncio.sleep(BATCH_WINDOW)
+            batch, self._batch = self._batch, []
+            self._batch_task = None
+
+            # Agrupa mensagens consecutivas de mesmo parse_mode sem exceder o limite do Telegram
+            groups = []  # [partes, parse_mode, futures, tamanho]
+            for message, parse_mode, future in batch:
+                if groups:
+                    group = groups[-1]
+                    size = group[3] + len(_BATCH_SEPARATOR) + len(message)
+                    if group[1] == parse_mode and size <= TELEGRAM_MAX_MESSAGE_LENGTH:
+                        group[0].append(message)
+                        group[2].append(future)
+                        group[3] = size
+                        continue
+                groups.append([[message], parse_mode, [future], len(message)])
+
+            results = await asyncio.gather(*(
+                self._post(_BATCH_SEPARATOR.join(parts), parse_mode)
+                for parts, parse_mode, _, _ in groups
+            ))
+            for (_, _, futures, _), sent in zip(groups, results):
+                for future in futures:
+                    if not future.done():
+                        future.set_result(sent)
+        finally:
+            # Cancelado ainda na janela: libera o lote para não deixar chamadores presos
+            if self._batch_task is asyncio.current_task():
+                batch, self._batch = self._batch, []
+                self._batch_task = None
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _post(self, message, parse_mode):
+        """
+        Faz o sendMessage na API do Telegram; retorna True em caso de sucesso.
+        Falhas transitórias são repetidas até SEND_ATTEMPTS vezes, respeitando o
+        Retry-After das respostas 429.
+        """
+        # Serializado uma única vez (orjson), reaproveitado nas novas tentativas
+        body = orjson.dumps({
+            'chat_id': self.chat_id,
+            'text': message,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': True
+        })
+        error = None
+
+        for attempt in range(SEND_ATTEMPTS):
+            delay = SEND_RETRY_BASE_DELAY * 2 ** attempt
+            try:
+                # Cliente HTTP/2 compartilhado: envios simultâneos usam a mesma conexão
+                response = await get_telegram_client().post(
+                    self.api_url, content=body, headers=JSON_HEADERS, timeout=TELEGRAM_TIMEOUT
+                )
+                if response.status_code == 429 or response.status_code >= 500:
+                    error = f"HTTP {response.status_code}"
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = max(delay, int(retry_after))
+                else:
+                    response.raise_for_status()
+                    logger.debug("Mensagem enviada com sucesso para o chat %s", self.chat_id)
+                    return True
+            except httpx.TransportError as e:
+                error = e
+            except Exception as e:
+                logger.error("Erro ao enviar mensagem pelo Telegram: %s", e)
+                return False
+
+            if attempt + 1 < SEND_ATTEMPTS:
+                await asyncio.sleep(delay)
+
+        logger.error("Erro ao enviar mensagem pelo Telegram após %d tentativas: %s", SEND_ATTEMPTS, error)
+        return False
             
     async def send_trade_notification(self, action, token, amount, price, pool_name=None, signature=None, pool_data=None):
         """
@@ -100,60 +320,40 @@ class TelegramNotifier:
             signature (str, optional): Assinatura da transação
             pool_data (dict, optional): Dados adicionais da pool (TVL, volume, etc)
         """
+        if not self.enabled:
+            return
+
+        # Cotação SOL/USD buscada em paralelo com a montagem da mensagem
+        price_task = asyncio.create_task(self.get_sol_price_usd())
         now = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
         
         # Atualiza contador de trades (apenas para uso interno)
         if action == "COMPRA":
             self.trades_count["compras"] += 1
-            emoji = "🟢"
-            header = f"{emoji} <b>COMPRA REALIZADA</b> {emoji}"
-            value_emoji = "💸"
+            header, value_emoji = _TRADE_HEADERS["COMPRA"]
         else:  # VENDA
             self.trades_count["vendas"] += 1
-            emoji = "🔴"
-            header = f"{emoji} <b>VENDA REALIZADA</b> {emoji}"
-            value_emoji = "💰"
+            header, value_emoji = _TRADE_HEADERS["VENDA"]
             
-        # Formata o valor com separador de milhares e 4 casas decimais
-        formatted_amount = f"{amount:,.4f}".replace(",", ".")
-        formatted_price = f"{price:.10f}".replace(".", ",")
+        # Formata o valor com separador de milhares e 4 casas decimais (padrão pt-BR)
+        formatted_amount = f"{amount:,.4f}".translate(_PT_BR_NUMBER)
+        formatted_price = f"{price:.10f}".translate(_PT_BR_NUMBER)
         
         # Calcula valor em SOL
         sol_value = amount * price
         
-        # Tenta obter o preço do SOL em USD
-        sol_price_usd = await self.get_sol_price_usd()
-        usd_value = ""
-        if sol_price_usd:
-            usd_amount = sol_value * sol_price_usd
-            usd_value = f"\n• <b>Valor (USD):</b> ${usd_amount:.2f}"
-        
-        # Cria um bloco para os detalhes da operação
-        details = (
-            f"• <b>Token:</b> {token}\n"
-            f"• <b>Quantidade:</b> {formatted_amount} tokens\n"
-            f"• <b>Preço:</b> {value_emoji} {formatted_price} SOL\n"
-            f"• <b>Valor (SOL):</b> {sol_value:.6f} SOL{usd_value}\n"
-            f"• <b>Data/Hora:</b> {now}"
-        )
-        
         # Adiciona tempo de execução para compras se disponível
         execution_time_info = ""
         if action == "COMPRA" and pool_data and "elapsed_time" in pool_data:
             elapsed_time = pool_data.get("elapsed_time", 0)
             execution_time_info = f"\n• <b>Tempo de execução:</b> {elapsed_time:.2f} segundos"
-            details += execution_time_info
         
         # Adiciona dados da pool (apenas TVL e Reserva SOL que são mais relevantes)
         pool_info = ""
         if pool_data:
-            tvl = pool_data.get("tvl", 0)
-            sol_reserve = pool_data.get("sol_reserve", 0)
-            
-            pool_info = (
-                f"\n\n📊 <b>DADOS DA POOL</b>\n"
-                f"• <b>TVL:</b> {tvl:.2f} SOL\n"
-                f"• <b>Reserva SOL:</b> {sol_reserve:.2f} SOL"
+            pool_info = _TRADE_POOL_TEMPLATE.format(
+                tvl=pool_data.get("tvl", 0),
+                sol_reserve=pool_data.get("sol_reserve", 0)
             )
         
         # Adiciona link para a transação se disponível
@@ -163,7 +363,26 @@ class TelegramNotifier:
                 f"\n\n🔍 <a href='https://solscan.io/tx/{signature}'>Ver transação</a>"
             )
         
-        message = f"{header}\n\n{details}{pool_info}{tx_link}"
+        # Preço do SOL em USD (a consulta já está em andamento)
+        sol_price_usd = await price_task
+        usd_value = ""
+        if sol_price_usd:
+            usd_amount = sol_value * sol_price_usd
+            usd_value = f"\n• <b>Valor (USD):</b> ${usd_amount:.2f}"
+        
+        message = _TRADE_TEMPLATE.format_map({
+            "header": header,
+            "token": token,
+            "amount": formatted_amount,
+            "value_emoji": value_emoji,
+            "price": formatted_price,
+            "sol_value": sol_value,
+            "usd_value": usd_value,
+            "now": now,
+            "execution_time_info": execution_time_info,
+            "pool_info": pool_info,
+            "tx_link": tx_link
+        })
         
         await self.send_message(message)
         
@@ -180,6 +399,11 @@ class TelegramNotifier:
             time_elapsed (float, optional): Tempo total da operação em segundos
             trade_data (dict, optional): Dados adicionais da operação (quantidade, timestamp, etc)
         """
+        if not self.enabled:
+            return
+
+        # Cotação SOL/USD buscada em paralelo com a montagem da mensagem
+        price_task = asyncio.create_task(self.get_sol_price_usd())
         now = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
         
         # Atualiza estatísticas internas
@@ -188,25 +412,11 @@ class TelegramNotifier:
             self.successful_trades += 1
         
         # Define emojis e cabeçalho com base no resultado (lucro ou prejuízo)
-        if profit_percentage > 0:
-            header_emoji = "💎"
-            result_emoji = "📈"
-            header = f"{header_emoji} <b>LUCRO REALIZADO</b> {header_emoji}"
-        else:
-            header_emoji = "📉"
-            result_emoji = "⚠️"
-            header = f"{header_emoji} <b>PREJUÍZO REGISTRADO</b> {header_emoji}"
+        header, result_emoji = _PROFIT_HEADERS[profit_percentage > 0]
         
         # Formata os valores numéricos
-        formatted_profit_pct = f"{profit_percentage:.2f}%".replace(".", ",")
-        formatted_profit_sol = f"{profit_amount:.6f}".replace(".", ",")
-        
-        # Tenta obter o preço do SOL em USD
-        sol_price_usd = await self.get_sol_price_usd()
-        usd_value = ""
-        if sol_price_usd:
-            usd_amount = profit_amount * sol_price_usd
-            usd_value = f"\n• <b>Lucro (USD):</b> ${usd_amount:.2f}"
+        formatted_profit_pct = f"{profit_percentage:.2f}%".translate(_PT_BR_NUMBER)
+        formatted_profit_sol = f"{profit_amount:.6f}".translate(_PT_BR_NUMBER)
         
         # Obtém quantidades do trade se disponíveis
         quantity_info = ""
@@ -214,25 +424,13 @@ class TelegramNotifier:
             quantity = trade_data.get("quantity", 0)
             quantity_info = f"\n• <b>Quantidade negociada:</b> {quantity:,.4f} tokens"
         
-        # Cria o bloco principal
-        details = (
-            f"• <b>Token:</b> {token}\n"
-            f"• <b>Resultado:</b> {result_emoji} {formatted_profit_pct}\n"
-            f"• <b>Lucro (SOL):</b> {formatted_profit_sol} SOL{usd_value}{quantity_info}\n"
-            f"• <b>Data/Hora:</b> {now}"
-        )
-        
         # Adiciona informações de preço se disponíveis
         prices = ""
         if buy_price and sell_price:
-            buy_price_fmt = f"{buy_price:.10f}".replace(".", ",")
-            sell_price_fmt = f"{sell_price:.10f}".replace(".", ",")
+            buy_price_fmt = f"{buy_price:.10f}".translate(_PT_BR_NUMBER)
+            sell_price_fmt = f"{sell_price:.10f}".translate(_PT_BR_NUMBER)
             
-            prices = (
-                f"\n\n📊 <b>DETALHES DA OPERAÇÃO</b>\n"
-                f"• <b>Preço de compra:</b> {buy_price_fmt} SOL\n"
-                f"• <b>Preço de venda:</b> {sell_price_fmt} SOL"
-            )
+            prices = _PROFIT_PRICES_TEMPLATE.format(buy_price=buy_price_fmt, sell_price=sell_price_fmt)
             
             # Adiciona tempo da operação completa se disponível
             if time_elapsed:
@@ -252,7 +450,24 @@ class TelegramNotifier:
                 buy_execution_time = trade_data.get("buy_execution_time")
                 prices += f"\n• <b>Tempo de finalização na blockchain:</b> {buy_execution_time} segundos"
         
-        message = f"{header}\n\n{details}{prices}"
+        # Preço do SOL em USD (a consulta já está em andamento)
+        sol_price_usd = await price_task
+        usd_value = ""
+        if sol_price_usd:
+            usd_amount = profit_amount * sol_price_usd
+            usd_value = f"\n• <b>Lucro (USD):</b> ${usd_amount:.2f}"
+        
+        message = _PROFIT_TEMPLATE.format_map({
+            "header": header,
+            "token": token,
+            "result_emoji": result_emoji,
+            "profit_pct": formatted_profit_pct,
+            "profit_sol": formatted_profit_sol,
+            "usd_value": usd_value,
+            "quantity_info": quantity_info,
+            "now": now,
+            "prices": prices
+        })
         
         await self.send_message(message)
     
@@ -265,28 +480,26 @@ class TelegramNotifier:
             error_type (str, optional): Tipo de erro (API, Blockchain, Configuração, etc)
             suggestions (list, optional): Lista de sugestões para resolver o problema
         """
-        now = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        if not self.enabled:
+            return
+
+        # Um único datetime.now() para a data/hora e o uptime
+        now = datetime.now()
+        now_str = now.strftime("%d/%m/%Y %H:%M:%S")
         
         # Define tipo de erro
         error_type_str = error_type or "Geral"
         
         # Escolhe emoji adequado ao tipo de erro
-        error_emoji = {
-            "API": "🔌",
-            "Blockchain": "⛓️",
-            "Configuração": "⚙️",
-            "Conexão": "📡",
-            "Transação": "💸",
-            "Geral": "⚠️"
-        }.get(error_type_str, "🚨")
+        error_emoji = _ERROR_EMOJI.get(error_type_str, "🚨")
         
         header = f"{error_emoji} <b>ERRO DETECTADO: {error_type_str}</b> {error_emoji}"
         
         # Formata a mensagem principal
         details = (
             f"• <b>Mensagem:</b> {error_message}\n"
-            f"• <b>Data/Hora:</b> {now}\n"
-            f"• <b>Uptime:</b> {str(datetime.now() - self.start_time).split('.')[0]}"
+            f"• <b>Data/Hora:</b> {now_str}\n"
+            f"• <b>Uptime:</b> {self._uptime_str(now)}"
         )
         
         # Adiciona sugestões se disponíveis
@@ -310,25 +523,19 @@ class TelegramNotifier:
             pools_info (list, optional): Lista com informações das pools
             trade_config (dict, optional): Configurações de trading do bot
         """
-        now = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        uptime = datetime.now() - self.start_time
-        
-        if status.lower() == 'iniciado':
-            emoji = "🚀"
-            header = f"{emoji} <b>BOT DE TRADING INICIADO</b> {emoji}"
-        elif status.lower() == 'parado':
-            emoji = "🛑"
-            header = f"{emoji} <b>BOT DE TRADING PARADO</b> {emoji}"
-        elif status.lower() == 'monitorando':
-            emoji = "👁️"
-            header = f"{emoji} <b>BOT EM MONITORAMENTO ATIVO</b> {emoji}"
-        else:
-            emoji = "ℹ️"
-            header = f"{emoji} <b>STATUS DO BOT: {status.upper()}</b> {emoji}"
+        if not self.enabled:
+            return
+
+        now = datetime.now()
+        now_str = now.strftime("%d/%m/%Y %H:%M:%S")
+        
+        header = _STATUS_HEADER.get(status.lower())
+        if header is None:
+            header = f"ℹ️ <b>STATUS DO BOT: {status.upper()}</b> ℹ️"
         
         details = (
-            f"• <b>Data/Hora:</b> {now}\n"
-            f"• <b>Uptime:</b> {str(uptime).split('.')[0]}"
+            f"• <b>Data/Hora:</b> {now_str}\n"
+            f"• <b>Uptime:</b> {self._uptime_str(now)}"
         )
         
         if pools_count:
@@ -360,27 +567,20 @@ class TelegramNotifier:
         
         pools_list = ""
         if pools_info and len(pools_info) > 0:
-            # Calcula o valor total em SOL das pools
-            total_reserve = sum(pool.get('sol_reserve', 0) for pool in pools_info)
+            # Valor total em SOL e as 5 maiores pools na mesma passada
+            total_reserve, top_pools = _top_pools(pools_info, 5)
             
             pools_list = (
-                f"\n\n💦 <b>TOP {min(5, len(pools_info))} POOLS (Total: {total_reserve:.2f} SOL)</b>"
+                f"\n\n💦 <b>TOP {len(top_pools)} POOLS (Total: {total_reserve:.2f} SOL)</b>"
             )
             
-            for i, pool in enumerate(pools_info[:5], 1):
+            for i, pool in enumerate(top_pools, 1):
                 pool_name = pool.get('token_pair', 'N/A')
                 sol_reserve = pool.get('sol_reserve', 0)
                 pools_list += f"\n{i}. {pool_name} - {sol_reserve:.2f} SOL"
         
-        message = f"{header}\n\n{details}{stats}{config_info}{pools_list}"
-        
-        # Adiciona informações do sistema
-        message += (
-            f"\n\n💻 <b>INFORMAÇÕES DO SISTEMA</b>\n"
-            f"• <b>Versão:</b> Bot Multi-Pool GRPC v1.1.0\n"
-            f"• <b>Rede:</b> Solana Mainnet\n"
-            f"• <b>Provider:</b> Helius GRPC"
-        )
+        # Informações do sistema ao final
+        message = f"{header}\n\n{details}{stats}{config_info}{pools_list}{_SYSTEM_INFO_BLOCK}"
         
         await self.send_message(message)
     
@@ -395,10 +595,13 @@ class TelegramNotifier:
             previous_price (float, optional): Preço anterior
             pool_data (dict, optional): Dados adicionais da pool
         """
+        if not self.enabled:
+            return
+
         now = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
         
-        formatted_price = f"{price:.10f}".replace(".", ",")
-        formatted_drop = f"{drop_percentage:.2f}%".replace(".", ",")
+        formatted_price = f"{price:.10f}".translate(_PT_BR_NUMBER)
+        formatted_drop = f"{drop_percentage:.2f}%".translate(_PT_BR_NUMBER)
         
         # Cria mensagem simples com informações essenciais
         message = (
@@ -409,7 +612,7 @@ class TelegramNotifier:
         )
         
         if previous_price:
-            formatted_prev = f"{previous_price:.10f}".replace(".", ",")
+            formatted_prev = f"{previous_price:.10f}".translate(_PT_BR_NUMBER)
             message += f"\n• <b>Preço anterior:</b> {formatted_prev} SOL"
         
         # Adiciona apenas a reserva SOL da pool, que é o dado mais relevante
@@ -418,6 +621,16 @@ class TelegramNotifier:
             message += f"\n• <b>Reserva SOL:</b> {sol_reserve:.2f} SOL"
         
         message += "\n\n🚀 <i>Preparando operação de compra...</i>"
+
+        # Descarta o alerta se uma mensagem idêntica saiu há menos de PRICE_ALERT_DEDUP_TTL segundos
+        now_mono = time.monotonic()
+        if len(self._recent_alerts) > 256:
+            self._recent_alerts = {h: exp for h, exp in self._recent_alerts.items() if exp > now_mono}
+        key = hash(message)
+        if self._recent_alerts.get(key, 0) > now_mono:
+            logger.debug("Alerta de preço duplicado descartado")
+            return
+        self._recent_alerts[key] = now_mono + PRICE_ALERT_DEDUP_TTL
         
         await self.send_message(message)
     
@@ -429,6 +642,9 @@ class TelegramNotifier:
             pools_info (list, optional): Lista com informações das pools
             trading_stats (dict, optional): Estatísticas de trading do dia
         """
+        if not self.enabled:
+            return
+
         now = datetime.now()
         formatted_date = now.strftime("%d/%m/%Y")
         
@@ -457,14 +673,14 @@ class TelegramNotifier:
         # Top pools (apenas as 3 principais)
         pools_list = ""
         if pools_info and len(pools_info) > 0:
-            # Ordenar pools por reserva de SOL
-            sorted_pools = sorted(pools_info, key=lambda x: x.get('sol_reserve', 0), reverse=True)
+            # Seleciona as 3 maiores pools por reserva de SOL, sem ordenar a lista inteira
+            _, top_pools = _top_pools(pools_info, 3)
             
             pools_list = (
                 f"\n\n💦 <b>TOP 3 POOLS</b>"
             )
             
-            for i, pool in enumerate(sorted_pools[:3], 1):
+            for i, pool in enumerate(top_pools, 1):
                 pool_name = pool.get('token_pair', 'N/A')
                 sol_reserve = pool.get('sol_reserve', 0)
                 pools_list += f"\n{i}. {pool_name} - {sol_reserve:.2f} SOL"
@@ -477,7 +693,10 @@ class TelegramNotifier:
 # Exemplo de uso como script independente
 async def test_notification():
     notifier = TelegramNotifier()
-    await notifier.send_message("🤖 Bot de trading iniciado!")
+    try:
+        await notifier.send_message("🤖 Bot de trading iniciado!")
+    finally:
+        await close_session()
     
 if __name__ == "__main__":
     asyncio.run(test_notification()) 
\ No newline at end of file
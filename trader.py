@@ -1,45 +1,280 @@
-import json
+import orjson
+import logging
 import os
 import time
+import random
 import asyncio
-import aiohttp
+import base64
+import copy
+import functools
+from types import MappingProxyType
 from bxsolana_trader_proto import api as proto
 from bxsolana.transaction import signing
+import websockets
 from websockets.exceptions import ConnectionClosedError
 from asyncio import IncompleteReadError
 from colorama import Fore, Back, Style
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from dotenv import load_dotenv
 
 # Importando formatadores
 from formatters import format_info, format_success, format_error, format_warning, format_price, format_sol
+from http_session import get_rpc_client
 
-async def get_token_balance(owner: str, token_mint: str) -> float:
+load_dotenv()
+
+# URL do RPC do Helius montada uma única vez no import (None sem API key; cada consulta
+# avisa e retorna sem chamar a rede)
+HELIUS_API_KEY = os.getenv("HELIUS_API_KEY", "")
+HELIUS_RPC_URL = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}" if HELIUS_API_KEY else None
+HELIUS_WS_URL = f"wss://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}" if HELIUS_API_KEY else None
+if not HELIUS_RPC_URL:
+    logging.error("HELIUS_API_KEY não definida: consultas de saldo e confirmação ficarão indisponíveis")
+
+# Espera entre consultas de confirmação: backoff exponencial a partir de ~1 slot (400ms),
+# limitado ao intervalo informado pelo chamador, com jitter
+POLL_BASE_DELAY = 0.4
+POLL_JITTER = 0.2
+
+def poll_delay(attempt: int, max_delay: float) -> float:
+    """Intervalo antes da consulta de número `attempt` (0, 1, 2, ...)."""
+    return min(POLL_BASE_DELAY * 2 ** attempt, max_delay) + random.random() * POLL_JITTER
+
+# Cache curto de saldos: (owner, mint) -> (time.monotonic() da consulta, Task da consulta).
+# Leituras simultâneas ou muito próximas (ex.: variantes da venda concorrente) viram uma só RPC.
+BALANCE_CACHE_TTL = 0.75  # segundos
+BALANCE_CACHE_SIZE = 64
+_balance_cache = {}
+
+async def get_token_balance(owner: str, token_mint: str, ttl: float = BALANCE_CACHE_TTL) -> float:
+    """
+    Retorna o saldo (uiAmount) do token, reaproveitando consultas feitas há menos de
+    `ttl` segundos. ttl=0 força uma nova consulta (ex.: aguardando o saldo mudar).
+    """
+    key = (owner, token_mint)
+    hit = _balance_cache.get(key)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return await asyncio.shield(hit[1])
+    
+    task = asyncio.create_task(_fetch_token_balance(owner, token_mint))
+    _balance_cache.pop(key, None)
+    if len(_balance_cache) >= BALANCE_CACHE_SIZE:
+        del _balance_cache[next(iter(_balance_cache))]
+    _balance_cache[key] = (time.monotonic(), task)
+    try:
+        # shield: o cancelamento de quem aguarda não interrompe a consulta compartilhada
+        return await asyncio.shield(task)
+    except Exception:
+        if _balance_cache.get(key, (0, None))[1] is task:
+            del _balance_cache[key]
+        raise
+
+def invalidate_token_balance(owner: str, token_mint: str):
+    """Descarta o saldo em cache (chamar após um swap confirmado)."""
+    _balance_cache.pop((owner, token_mint), None)
+
+async def _fetch_token_balance(owner: str, token_mint: str) -> float:
+    """Consulta o saldo atualizado (uiAmount) de um único token."""
+    return (await get_balances(owner, [token_mint]))[token_mint]
+
+# Programas usados para derivar as contas de token associadas (ATA) localmente
+TOKEN_PROGRAM_ID = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+TOKEN_2022_PROGRAM_ID = Pubkey.from_string("TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb")
+ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
+_TOKEN_ACCOUNT_OPTIONS = {"encoding": "jsonParsed", "commitment": "processed"}
+# Limite de contas por chamada de getMultipleAccounts
+MULTIPLE_ACCOUNTS_LIMIT = 100
+
+@functools.lru_cache(maxsize=256)
+def _token_accounts(owner: str, token_mint: str) -> tuple:
+    """
+    ATAs de owner para token_mint no Token Program e no Token-2022 (derivação local,
+    sem RPC). Só uma delas existe, conforme o programa do mint.
     """
-    Consulta o endpoint getTokenAccountsByOwner do Helius para obter o saldo atualizado
-    do token especificado, retornando o valor em uiAmount.
+    owner_key = bytes(Pubkey.from_string(owner))
+    mint_key = bytes(Pubkey.from_string(token_mint))
+    return tuple(
+        str(Pubkey.find_program_address([owner_key, bytes(program), mint_key], ASSOCIATED_TOKEN_PROGRAM_ID)[0])
+        for program in (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID)
+    )
+
+def _accounts_balance(accounts) -> float:
+    """Soma o uiAmount das contas (jsonParsed) retornadas por getMultipleAccounts."""
+    balance = 0.0
+    for account in accounts:
+        if account:
+            balance += account["data"]["parsed"]["info"]["tokenAmount"]["uiAmount"] or 0.0
+    return balance
+
+def _parse_token_balance(result) -> float:
+    """Saldo (uiAmount) a partir do resultado de getMultipleAccounts para as ATAs de um mint."""
+    return _accounts_balance((result or {}).get("value") or ())
+
+async def get_balances(owner: str, mints: list) -> dict:
     """
-    api_key = os.getenv("HELIUS_API_KEY", "")
-    if not api_key:
+    Saldos (uiAmount) de vários tokens de `owner` com uma única chamada getMultipleAccounts
+    por até MULTIPLE_ACCOUNTS_LIMIT contas, a partir das ATAs derivadas localmente.
+
+    :return: {mint: saldo}; 0.0 para tokens sem conta
+    """
+    if not HELIUS_RPC_URL:
         print(format_error("API Key do Helius não encontrada no ambiente (.env)"))
-        return 0.0
-    url = f"https://mainnet.helius-rpc.com/?api-key={api_key}"
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "getTokenAccountsByOwner",
-        "params": [
-            owner,
-            {"mint": token_mint},
-            {"encoding": "jsonParsed", "commitment": "processed"}
-        ]
-    }
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=payload) as response:
-            data = await response.json()
-            accounts = data.get("result", {}).get("value", [])
-            if accounts:
-                info = accounts[0]["account"]["data"]["parsed"]["info"]
-                return info["tokenAmount"]["uiAmount"]
-    return 0.0
+        return dict.fromkeys(mints, 0.0)
+    accounts = [account for mint in mints for account in _token_accounts(owner, mint)]
+    client = get_rpc_client()
+
+    async def fetch(chunk):
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getMultipleAccounts",
+            "params": [chunk, _TOKEN_ACCOUNT_OPTIONS]
+        }
+        response = await client.post(HELIUS_RPC_URL, json=payload)
+        data = orjson.loads(response.content)
+        return (data.get("result") or {}).get("value") or [None] * len(chunk)
+
+    chunks = await asyncio.gather(*(
+        fetch(accounts[i:i + MULTIPLE_ACCOUNTS_LIMIT])
+        for i in range(0, len(accounts), MULTIPLE_ACCOUNTS_LIMIT)
+    ))
+    values = [value for chunk in chunks for value in chunk]
+    # Duas ATAs por mint (Token Program e Token-2022), na ordem de `mints`
+    return {mint: _accounts_balance(values[2 * i:2 * i + 2]) for i, mint in enumerate(mints)}
+
+# Erros de instrução que não se resolvem com nova tentativa, com a mensagem exibida.
+# Formato do RPC: {"InstructionError": [índice, "IllegalOwner"]} ou [índice, {"Custom": n}]
+FATAL_INSTRUCTION_ERRORS = MappingProxyType({
+    "IllegalOwner": "Erro de IllegalOwner detectado. Problemas com ATA ou permissões.",
+})
+
+def fatal_instruction_error(err):
+    """
+    Retorna o nome do erro de instrução conhecido (ex.: "IllegalOwner") contido em
+    meta.err / value.err, ou None. Inspeciona o dict sem serializá-lo.
+    """
+    if not isinstance(err, dict):
+        return None
+    instruction_error = err.get("InstructionError")
+    if isinstance(instruction_error, list) and len(instruction_error) > 1:
+        detail = instruction_error[1]
+        if isinstance(detail, str) and detail in FATAL_INSTRUCTION_ERRORS:
+            return detail
+    return None
+
+# Params de getSignatureStatuses: só o cache de status recentes do nó (transações recém-enviadas)
+_SIGNATURE_STATUS_OPTIONS = {"searchTransactionHistory": False}
+_CONFIRMED_STATUSES = frozenset(("confirmed", "finalized"))
+
+def _report_tx_error(err):
+    """Exibe o erro (meta.err / value.err) de uma transação que falhou."""
+    # Verifica erros específicos
+    if isinstance(err, dict) and "InstructionError" in err:
+        print(format_error(f"Erro de instrução na transação: {err}"))
+        
+        # Detectar erros conhecidos (ex.: IllegalOwner) no detalhe da instrução
+        fatal = fatal_instruction_error(err)
+        if fatal:
+            print(format_error(FATAL_INSTRUCTION_ERRORS[fatal]))
+    else:
+        print(format_error(f"Transação falhou: {err}"))
+
+def _transaction_status(result):
+    """
+    Interpreta o resultado de getSignatureStatuses para uma única assinatura
+    (apenas slot, err e confirmationStatus, em vez da transação completa).
+
+    :return: True se a transação foi confirmada sem erro, False se falhou,
+             None se ainda não está disponível
+    """
+    statuses = (result or {}).get("value")
+    status = statuses[0] if statuses else None
+    if status is None:
+        return None
+    
+    # Verificar se há erro na transação
+    err = status.get("err")
+    if err is not None:
+        _report_tx_error(err)
+        return False
+    
+    # Sem erro: confirmada a partir do commitment "confirmed" ("processed" ainda aguarda)
+    if status.get("confirmationStatus") in _CONFIRMED_STATUSES:
+        return True
+    return None
+
+def _signature_landed(result) -> bool:
+    """True se getSignatureStatuses já vê a transação (qualquer commitment) sem erro."""
+    statuses = (result or {}).get("value")
+    return bool(statuses) and statuses[0] is not None and statuses[0].get("err") is None
+
+async def helius_batch(calls):
+    """
+    Envia várias chamadas JSON-RPC ao Helius em uma única requisição HTTP (batch).
+
+    :param calls: Lista de tuplas (método, params)
+    :return: Lista com o "result" de cada chamada, na mesma ordem (None em caso de erro),
+             ou None se a API key não estiver configurada
+    """
+    if not HELIUS_RPC_URL:
+        print(format_error("API Key do Helius não encontrada no ambiente (.env)"))
+        return None
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    response = await get_rpc_client().post(HELIUS_RPC_URL, json=payload)
+    data = orjson.loads(response.content)
+    if not isinstance(data, list):
+        raise RuntimeError(f"Resposta inesperada do batch JSON-RPC: {data}")
+    # A ordem das respostas de um batch não é garantida: reordena pelo id
+    results = [None] * len(calls)
+    for item in data:
+        results[item["id"]] = item.get("result")
+    return results
+
+async def confirm_with_balance(signature: str, owner: str, token_mint: str, max_attempts: int = 10, sleep_time: int = 2,
+                               balance_ready: asyncio.Future = None):
+    """
+    Aguarda a confirmação de uma compra consultando, a cada tentativa, getSignatureStatuses e
+    getMultipleAccounts (ATAs do token) em um único batch JSON-RPC. As consultas seguem poll_delay;
+    o prazo total é max_attempts * sleep_time segundos.
+
+    :param balance_ready: Future resolvida com o saldo assim que a transação aparece sem erro
+                          e o saldo é positivo, antes da confirmação (commitment "confirmed")
+    :return: (confirmada, saldo do token na última consulta)
+    """
+    calls = [
+        ("getSignatureStatuses", [[signature], _SIGNATURE_STATUS_OPTIONS]),
+        ("getMultipleAccounts", [list(_token_accounts(owner, token_mint)), _TOKEN_ACCOUNT_OPTIONS])
+    ]
+    status = None
+    balance = 0.0
+    deadline = time.monotonic() + max_attempts * sleep_time
+    attempt = 0
+    while True:
+        try:
+            await asyncio.sleep(poll_delay(attempt, sleep_time))
+            results = await helius_batch(calls)
+            if results is None:
+                return False, 0.0
+            status = _transaction_status(results[0])
+            balance = _parse_token_balance(results[1])
+            if (balance_ready is not None and not balance_ready.done()
+                    and balance > 0 and _signature_landed(results[0])):
+                balance_ready.set_result(balance)
+            if status is False or (status and balance > 0):
+                break
+        except Exception as e:
+            print(format_warning(f"Erro ao verificar transação (tentativa {attempt+1}): {str(e)}"))
+        attempt += 1
+        if time.monotonic() >= deadline:
+            break
+        # Depois que o chamador seguiu com o saldo, a confirmação continua sem poluir o console
+        if balance_ready is None or not balance_ready.done():
+            print(f"{Fore.CYAN}⏳ Verificando transação... (tentativa {attempt}){Style.RESET_ALL}")
+    return status is True, balance
 
 async def verify_transaction_status(signature: str, max_attempts: int = 10, sleep_time: int = 2) -> bool:
     """
@@ -47,105 +282,251 @@ async def verify_transaction_status(signature: str, max_attempts: int = 10, slee
     
     Args:
         signature: Assinatura da transação a ser verificada
-        max_attempts: Número máximo de tentativas de verificação
-        sleep_time: Tempo de espera entre as tentativas em segundos
+        max_attempts: Junto com sleep_time define o prazo total (max_attempts * sleep_time segundos)
+        sleep_time: Intervalo máximo entre as consultas em segundos; as primeiras seguem
+                    o backoff de poll_delay, começando em ~400ms
         
     Returns:
         bool: True se a transação foi confirmada, False caso contrário
     """
-    api_key = os.getenv("HELIUS_API_KEY", "")
-    if not api_key:
+    if not HELIUS_RPC_URL:
         print(format_error("API Key do Helius não encontrada no ambiente (.env)"))
         return False
-        
-    url = f"https://mainnet.helius-rpc.com/?api-key={api_key}"
     
-    for attempt in range(max_attempts):
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getSignatureStatuses",
+        "params": [[signature], _SIGNATURE_STATUS_OPTIONS]
+    }
+    deadline = time.monotonic() + max_attempts * sleep_time
+    attempt = 0
+    while True:
         try:
-            await asyncio.sleep(sleep_time)
+            await asyncio.sleep(poll_delay(attempt, sleep_time))
             
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTransaction",
-                "params": [signature, {"commitment": "confirmed"}]
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
-                    data = await response.json()
-                    result = data.get("result")
-                    
-                    if result:
-                        # Se temos um resultado, verificamos o status
-                        if result.get("meta") is not None:
-                            meta = result.get("meta", {})
-                            
-                            # Verificar se há erro na transação
-                            err = meta.get("err")
-                            if err is not None:
-                                # Verifica erros específicos
-                                if isinstance(err, dict) and "InstructionError" in str(err):
-                                    error_detail = str(err)
-                                    print(format_error(f"Erro de instrução na transação: {error_detail}"))
-                                    
-                                    # Detectar erro específico do IllegalOwner
-                                    if "IllegalOwner" in error_detail:
-                                        print(format_error("Erro de IllegalOwner detectado. Problemas com ATA ou permissões."))
-                                    return False
-                                else:
-                                    print(format_error(f"Transação falhou: {err}"))
-                                    return False
-                            
-                            # Se não há erro e temos o slot, consideramos confirmada
-                            if result.get("slot") and meta.get("err") is None:
-                                return True
-                            
-                            # Formato antigo de status
-                            status_info = meta.get("status", {})
-                            if isinstance(status_info, dict):
-                                if "Ok" in status_info:
-                                    return True
-                                elif "Err" in status_info:
-                                    print(format_error(f"Transação falhou: {status_info.get('Err')}"))
-                                    return False
-                    
-                    if attempt + 1 < max_attempts:
-                        print(f"{Fore.CYAN}⏳ Verificando transação... ({attempt+1}/{max_attempts}){Style.RESET_ALL}")
-                    
+            response = await get_rpc_client().post(HELIUS_RPC_URL, json=payload)
+            data = orjson.loads(response.content)
+            status = _transaction_status(data.get("result"))
+            if status is not None:
+                return status
+                
         except Exception as e:
             print(format_warning(f"Erro ao verificar transação (tentativa {attempt+1}): {str(e)}"))
-    
-    # Se chegamos aqui, atingimos o número máximo de tentativas sem confirmação
-    return False
+        
+        attempt += 1
+        if time.monotonic() >= deadline:
+            # Prazo esgotado sem confirmação
+            return False
+        print(f"{Fore.CYAN}⏳ Verificando transação... (tentativa {attempt}){Style.RESET_ALL}")
 
-async def get_transaction_time(signature: str, api_key: str) -> int:
+async def fast_status(signature: str) -> str:
     """
-    Consulta o endpoint getTransaction para obter o blockTime (timestamp Unix)
-    da transação finalizada, utilizando o commitment "finalized".
-    Se o blockTime não estiver disponível, retorna 0.
+    Consulta getSignatureStatuses uma única vez.
+
+    :return: "processed", "confirmed" ou "finalized" se a transação está no cluster sem erro,
+             "failed" se falhou, "unknown" se ainda não aparece (ou a consulta falhou)
     """
-    if not api_key:
-        print(format_error("API Key do Helius não fornecida"))
-        return 0
-    url = f"https://mainnet.helius-rpc.com/?api-key={api_key}"
+    if not HELIUS_RPC_URL:
+        return "unknown"
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
-        "method": "getTransaction",
-        "params": [signature, {"commitment": "finalized"}]
+        "method": "getSignatureStatuses",
+        "params": [[signature], _SIGNATURE_STATUS_OPTIONS]
     }
-    timeout = 30
-    start = time.time()
-    while time.time() - start < timeout:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                data = await response.json()
-                result = data.get("result")
-                if result and result.get("blockTime") is not None:
-                    return result["blockTime"]
-        await asyncio.sleep(1)
-    return 0
+    try:
+        response = await get_rpc_client().post(HELIUS_RPC_URL, json=payload)
+        data = orjson.loads(response.content)
+    except Exception as e:
+        logging.warning("Erro ao consultar o status de %s: %s", signature, e)
+        return "unknown"
+    statuses = (data.get("result") or {}).get("value")
+    status = statuses[0] if statuses else None
+    if status is None:
+        return "unknown"
+    if status.get("err") is not None:
+        _report_tx_error(status["err"])
+        return "failed"
+    return status.get("confirmationStatus") or "processed"
+
+# Venda: sondagem rápida para descartar logo uma transação que falhou (a venda só conta
+# como executada com "confirmed"); até SELL_FAST_PROBES consultas, SELL_FAST_PROBE_INTERVAL
+# segundos entre elas
+SELL_FAST_PROBES = 3
+SELL_FAST_PROBE_INTERVAL = 0.5
+# Acompanhamento em segundo plano até "finalized"
+SELL_FINALITY_TIMEOUT = 40
+SELL_FINALITY_INTERVAL = 2.0
+_finality_watchers = set()
+
+async def probe_landed(signature: str, probes: int = SELL_FAST_PROBES, interval: float = SELL_FAST_PROBE_INTERVAL):
+    """
+    :return: True se a transação já está no cluster sem erro, False se falhou,
+             None se continua desconhecida após `probes` consultas
+    """
+    for _ in range(probes):
+        await asyncio.sleep(interval)
+        status = await fast_status(signature)
+        if status == "failed":
+            return False
+        if status != "unknown":
+            return True
+    return None
+
+async def watch_finality(signature: str, timeout: float = SELL_FINALITY_TIMEOUT, interval: float = SELL_FINALITY_INTERVAL):
+    """Acompanha a transação até "finalized", registrando no log se ela falhar ou sumir."""
+    deadline = time.monotonic() + timeout
+    status = "unknown"
+    while time.monotonic() < deadline:
+        await asyncio.sleep(interval)
+        status = await fast_status(signature)
+        if status == "finalized":
+            logging.info("Transação %s finalizada", signature)
+            return
+        if status == "failed":
+            logging.warning("Transação %s falhou depois de aparecer como processada", signature)
+            return
+    logging.warning("Transação %s não finalizada em %ss (último status: %s)", signature, timeout, status)
+
+async def wait_signature_notification(signature: str, timeout: float = 30):
+    """
+    Assina signatureSubscribe (commitment "confirmed") no WebSocket do Helius e aguarda
+    a notificação da transação, em vez de consultar o status em intervalos fixos.
+    Retorna True se confirmada sem erro, False se falhou, ou None se a notificação
+    não chegou dentro do timeout (ou o WebSocket está indisponível).
+    """
+    if not HELIUS_WS_URL:
+        return None
+    request = orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "signatureSubscribe",
+        "params": [signature, {"commitment": "confirmed"}]
+    }).decode()
+    deadline = time.monotonic() + timeout
+    try:
+        async with websockets.connect(HELIUS_WS_URL) as ws:
+            await ws.send(request)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                message = orjson.loads(await asyncio.wait_for(ws.recv(), remaining))
+                # A primeira mensagem é a resposta com o id da subscrição
+                if message.get("method") != "signatureNotification":
+                    continue
+                err = message["params"]["result"]["value"].get("err")
+                if err is not None:
+                    _report_tx_error(err)
+                    return False
+                return True
+    except (asyncio.TimeoutError, OSError, websockets.WebSocketException) as e:
+        logging.warning("signatureSubscribe indisponível para %s: %s", signature, e)
+        return None
+
+def spawn_finality_watch(signature: str):
+    """Executa watch_finality em segundo plano, mantendo uma referência forte até o término."""
+    task = asyncio.create_task(watch_finality(signature))
+    _finality_watchers.add(task)
+    task.add_done_callback(_finality_watchers.discard)
+    return task
+
+# Linhas de assinatura pré-formatadas (cores resolvidas no import)
+_SIG_FMT = f"• Assinatura: {Fore.CYAN}{{}}...{{}}{Style.RESET_ALL}"
+_SOLSCAN_FMT = f"• Verificar em: {Fore.CYAN}https://solscan.io/tx/{{}}{Style.RESET_ALL}"
+
+# Converte SOL para lamports (1 SOL = 1,000,000,000 lamports)
+LAMPORTS_PER_SOL = 1_000_000_000
+
+# Parâmetros padrão de submissão (compra); a venda sobrescreve alguns em custom_submit
+_SUBMIT_DEFAULTS = MappingProxyType({
+    "skip_pre_flight": True,
+    "front_running_protection": True,
+    "fast_best_effort": True,
+    "use_staked_rpcs": False
+})
+# Sobrescritas usadas pela venda
+_SELL_SUBMIT_PARAMS = MappingProxyType({
+    "front_running_protection": False,
+    "fast_best_effort": False,
+    "use_staked_rpcs": True
+})
+
+# PostSubmitRequest com as flags já definidas, por combinação de parâmetros; cada
+# submissão copia o modelo e preenche apenas a transação
+_submit_templates = {}
+
+def _submit_template(params):
+    key = tuple(params.items())
+    template = _submit_templates.get(key)
+    if template is None:
+        template = proto.PostSubmitRequest(
+            skip_pre_flight=params["skip_pre_flight"],
+            front_running_protection=params["front_running_protection"],
+            fast_best_effort=params["fast_best_effort"]
+        )
+        # Campo opcional: só é enviado quando habilitado
+        if params["use_staked_rpcs"]:
+            template.use_staked_rp_cs = True
+        _submit_templates[key] = template
+    return template
+
+# Modelos de compra e venda criados no import
+_submit_template(_SUBMIT_DEFAULTS)
+_submit_template(_SUBMIT_DEFAULTS | _SELL_SUBMIT_PARAMS)
+
+# Limites das chamadas ao bloXroute: cada tentativa de post_raydium_swap / post_submit tem
+# seu próprio timeout. O prazo total do caminho de compra/venda vale só até a submissão;
+# depois dela, o submit reenvia a mesma transação assinada por até SUBMIT_RESPONSE_WINDOW
+SWAP_REQUEST_TIMEOUT = 1.5
+SUBMIT_TIMEOUT = 1.0
+SUBMIT_RESPONSE_WINDOW = 3.0
+TRADE_PATH_BUDGET = 5.0  # segundos desde a detecção da queda (compra) ou o início da venda
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 0.5
+
+async def call_with_budget(make_call, timeout: float, deadline: float):
+    """
+    Aguarda make_call() por até `timeout` segundos, repetindo com backoff exponencial
+    a cada timeout enquanto houver tempo até `deadline` (time.monotonic()).
+
+    :raises asyncio.TimeoutError: Se o prazo se esgotar sem resposta
+    """
+    attempt = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        try:
+            return await asyncio.wait_for(make_call(), min(timeout, remaining))
+        except asyncio.TimeoutError:
+            attempt += 1
+            delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+            if time.monotonic() + delay >= deadline:
+                raise
+            logging.warning("Chamada ao bloXroute sem resposta em %.1fs (tentativa %d)", timeout, attempt)
+            await asyncio.sleep(delay)
+
+# Transação de venda pré-construída durante o monitoramento de lucro: reconstruída a cada
+# SELL_TX_REFRESH_INTERVAL segundos e usada apenas se tiver menos de SELL_TX_MAX_AGE
+# segundos (bem dentro da validade do blockhash, ~60s)
+SELL_TX_REFRESH_INTERVAL = 15
+SELL_TX_MAX_AGE = 20
+
+# Espera máxima pela confirmação da compra quando a venda não encontra saldo
+BUY_CONFIRM_WAIT = 3.0
+
+# Acompanhamento de uma compra já submetida: até a expiração do blockhash (~60-90s) ela
+# ainda pode entrar, então só é dada como falha depois desse prazo
+BUY_LANDING_ATTEMPTS = 45
+BUY_LANDING_INTERVAL = 2
+
+def _signed_tx_signature(signed_tx_message) -> str:
+    """Assinatura do pagador (base58) lida da própria transação assinada."""
+    raw = base64.b64decode(signed_tx_message.content)
+    # Primeiro byte: quantidade de assinaturas (compact-u16, < 128); a do pagador vem em seguida
+    return str(Signature.from_bytes(raw[1:65]))
 
 class RaydiumTrader:
     def __init__(self, api, config):
@@ -156,6 +537,43 @@ class RaydiumTrader:
         """
         self.api = api
         self.config = config
+        # (time.monotonic() da construção, quantidade, transação unsigned)
+        self._sell_tx_cache = None
+        self._sell_tx_lock = asyncio.Lock()
+        # Fees já convertidas para lamports, por chave de configuração ("buy_settings"/"sell_settings")
+        self._fees_cache = {}
+        # Confirmações de compra ainda em andamento: assinatura -> Task de confirm_with_balance
+        self._pending_confirms = {}
+
+    async def _post_signed(self, request, signature: str) -> str:
+        """
+        Envia um submit já assinado. Sem resposta em SUBMIT_TIMEOUT, reenvia a mesma transação
+        (mesma assinatura, não duplica a operação) até SUBMIT_RESPONSE_WINDOW. Esgotado o prazo,
+        a transação pode já ter sido transmitida: retorna a assinatura para acompanhamento.
+        """
+        deadline = time.monotonic() + SUBMIT_RESPONSE_WINDOW
+        attempt = 0
+        while True:
+            try:
+                response = await asyncio.wait_for(
+                    self.api.post_submit(post_submit_request=request), SUBMIT_TIMEOUT
+                )
+                return response.signature or signature
+            except asyncio.TimeoutError:
+                attempt += 1
+            except Exception:
+                # Erro explícito só descarta a transação se nenhuma tentativa anterior ficou sem resposta
+                if not attempt:
+                    raise
+                logging.warning("Submit rejeitado após tentativa sem resposta; acompanhando %s", signature)
+                return signature
+            if time.monotonic() >= deadline:
+                print(format_warning(
+                    f"Submit sem resposta em {SUBMIT_RESPONSE_WINDOW:.1f}s; acompanhando a assinatura {signature[:8]}..."
+                ))
+                return signature
+            logging.warning("Submit sem resposta em %.1fs (tentativa %d), reenviando", SUBMIT_TIMEOUT, attempt)
+            await asyncio.sleep(min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY))
 
     async def custom_submit(self, tx_messages, **submit_params):
         """
@@ -170,33 +588,49 @@ class RaydiumTrader:
         Para venda, você pode sobrescrever esses valores, por exemplo:
           front_running_protection=False, fast_best_effort=False, use_staked_rpcs=True
 
-        OBS: O parâmetro 'use_staked_rpcs' será definido no objeto PostSubmitRequest via setattr apenas se for True.
+        OBS: O parâmetro 'use_staked_rpcs' corresponde ao campo use_staked_rp_cs do PostSubmitRequest
+        e só é enviado quando True.
+
+        Submissões sem resposta não são tratadas como falha: a assinatura (lida da transação
+        assinada) é retornada para que o chamador acompanhe o resultado na blockchain.
         """
-        defaults = {
-            "skip_pre_flight": True,
-            "front_running_protection": True,
-            "fast_best_effort": True,
-            "use_staked_rpcs": False
-        }
-        merged_params = {**defaults, **submit_params}
+        template = _submit_template(_SUBMIT_DEFAULTS | submit_params)
         pk = self.api.require_private_key()
+        tx_message_objs = [
+            proto.TransactionMessage(content=tx, is_cleanup=False) if isinstance(tx, str) else tx
+            for tx in tx_messages
+        ]
+        # Assinatura ed25519 (CPU) no pool de threads, sem travar o event loop
+        loop = asyncio.get_running_loop()
+        signed_tx_messages = await asyncio.gather(*(
+            loop.run_in_executor(None, signing.sign_tx_message_with_private_key, tx_message_obj, pk)
+            for tx_message_obj in tx_message_objs
+        ))
+        requests = []
+        for signed_tx_message in signed_tx_messages:
+            request = copy.copy(template)
+            request.transaction = signed_tx_message
+            requests.append(request)
+        
+        # Submissões independentes: enviadas juntas, o tempo total é ~1 RTT
+        results = await asyncio.gather(
+            *(
+                self._post_signed(request, _signed_tx_signature(request.transaction))
+                for request in requests
+            ),
+            return_exceptions=True
+        )
         signatures = []
-        for tx in tx_messages:
-            if isinstance(tx, str):
-                tx_message_obj = proto.TransactionMessage(content=tx, is_cleanup=False)
+        errors = []
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                print(format_error(f"Falha ao submeter a transação {i+1}/{len(results)}: {result}"))
+                errors.append(result)
             else:
-                tx_message_obj = tx
-            signed_tx_message = signing.sign_tx_message_with_private_key(tx_message_obj, pk)
-            request = proto.PostSubmitRequest(
-                transaction=signed_tx_message,
-                skip_pre_flight=merged_params["skip_pre_flight"],
-                front_running_protection=merged_params["front_running_protection"],
-                fast_best_effort=merged_params["fast_best_effort"]
-            )
-            if merged_params["use_staked_rpcs"]:
-                setattr(request, "useStakedRPCs", merged_params["use_staked_rpcs"])
-            result = await self.api.post_submit(post_submit_request=request)
-            signatures.append(result.signature)
+                signatures.append(result)
+        # Sem nenhuma submissão aceita, o erro segue para o chamador como antes
+        if errors and not signatures:
+            raise errors[0]
         return signatures
 
     async def execute_buy(self):
@@ -205,42 +639,27 @@ class RaydiumTrader:
         Após a submissão, calcula e exibe o tempo decorrido desde a detecção da queda até receber a resposta do submit.
         Armazena a assinatura da compra para ser utilizada após o ciclo de venda.
         """
-        # Obtém as configurações específicas de compra ou usa valores padrão
-        buy_settings = self.config.get("buy_settings", {})
-        
-        # Converte SOL para lamports (1 SOL = 1,000,000,000 lamports)
-        LAMPORTS_PER_SOL = 1_000_000_000
-        
-        # Obter valores em SOL e converter para lamports
-        compute_price_sol = buy_settings.get("compute_price_sol", 0.001)
-        priority_fee_sol = buy_settings.get("priority_fee_sol", 0.001)
-        
-        # Converter para lamports
-        compute_price = int(compute_price_sol * LAMPORTS_PER_SOL)
-        priority_fee = int(priority_fee_sol * LAMPORTS_PER_SOL)
-        
-        # Fallback para valores em lamports diretos, se disponíveis
-        if compute_price == 0:
-            compute_price = buy_settings.get("compute_price", 1_000_000)
-        if priority_fee == 0:
-            priority_fee = buy_settings.get("priority_fee", 1_000_000)
+        compute_price, priority_fee, compute_price_sol, priority_fee_sol = self._resolve_fees("buy_settings")
         
         print(f"\n{Fore.WHITE}{Back.BLUE} INICIANDO COMPRA {Style.RESET_ALL}")
         print(f"• Compute Price: {format_sol(compute_price_sol)}")
         print(f"• Priority Fee: {format_sol(priority_fee_sol)}")
         
-        request = proto.PostRaydiumSwapRequest(
-            owner_address=self.config["owner_address"],
+        request = self._build_swap_request(
             in_token=self.config["in_token"],
             out_token=self.config["out_token"],
             in_amount=self.config["trade_amount"],
-            slippage=self.config["slippage"],
-            compute_limit=1400000,
             compute_price=compute_price,
-            tip=priority_fee
+            priority_fee=priority_fee
         )
+        # Construção da compra limitada a TRADE_PATH_BUDGET desde a detecção da queda; uma vez
+        # submetida, a transação é acompanhada até confirmar ou expirar
+        deadline = self.config.get("drop_monotonic", time.monotonic()) + TRADE_PATH_BUDGET
         try:
-            swap_response = await self.api.post_raydium_swap(post_raydium_swap_request=request)
+            swap_response = await call_with_budget(
+                lambda: self.api.post_raydium_swap(post_raydium_swap_request=request),
+                SWAP_REQUEST_TIMEOUT, deadline
+            )
             unsigned_tx = swap_response.transactions[0].content
             if not unsigned_tx:
                 print(format_error("Transação unsigned de compra está vazia"))
@@ -249,7 +668,7 @@ class RaydiumTrader:
             print(format_info("Enviando transação para a blockchain..."))
             signatures = await self.custom_submit([unsigned_tx])
             if signatures:
-                elapsed_submit = time.time() - self.config["drop_timestamp"]
+                elapsed_submit = time.monotonic() - self.config["drop_monotonic"]
                 print(f"{Fore.YELLOW}⏱ Tempo de resposta: {elapsed_submit:.2f} segundos{Style.RESET_ALL}")
                 
                 # Armazena o tempo até o envio da transação para uso posterior
@@ -259,22 +678,35 @@ class RaydiumTrader:
                 signature = signatures[0]
                 
                 # Exibe assinatura formatada
-                short_sig = signature[:8] + "..." + signature[-8:]
-                print(f"• Assinatura: {Fore.CYAN}{short_sig}{Style.RESET_ALL}")
+                print(_SIG_FMT.format(signature[:8], signature[-8:]))
                 
                 print(format_info("Verificando confirmação na blockchain..."))
-                confirmed = await verify_transaction_status(signature)
+                # Confirmação e saldo comprado vêm da mesma consulta (batch JSON-RPC). A confirmação
+                # roda em uma tarefa própria: assim que o saldo aparece a compra segue, e a tarefa
+                # continua até a confirmação (consultável por wait_buy_confirmation)
+                balance_ready = asyncio.get_running_loop().create_future()
+                confirm_task = asyncio.create_task(confirm_with_balance(
+                    signature, self.config["owner_address"], self.config["out_token"],
+                    max_attempts=BUY_LANDING_ATTEMPTS, sleep_time=BUY_LANDING_INTERVAL,
+                    balance_ready=balance_ready
+                ))
+                self._pending_confirms[signature] = confirm_task
+                confirm_task.add_done_callback(lambda task, sig=signature: self._buy_confirm_done(sig, task))
+                await asyncio.wait((balance_ready, confirm_task), return_when=asyncio.FIRST_COMPLETED)
+                if confirm_task.done():
+                    confirmed, bought_amount = confirm_task.result()
+                else:
+                    # Saldo já visível; confirmação ainda pendente
+                    confirmed, bought_amount = False, balance_ready.result()
                 
                 if not confirmed:
                     print(format_warning("Transação enviada mas aguardando confirmação"))
-                    print(f"• Verificar em: {Fore.CYAN}https://solscan.io/tx/{signature}{Style.RESET_ALL}")
+                    print(_SOLSCAN_FMT.format(signature))
                 
                 # Armazena a assinatura da compra para consulta posterior
                 self.config["buy_signature"] = signature
-                await asyncio.sleep(2)
+                invalidate_token_balance(self.config["owner_address"], self.config["out_token"])
                 
-                # Obtém o saldo após a compra
-                bought_amount = await get_token_balance(self.config["owner_address"], self.config["out_token"])
                 if bought_amount is None or bought_amount <= 0:
                     print(format_error("Não foi possível obter o saldo após a compra"))
                     return signature
@@ -295,11 +727,137 @@ class RaydiumTrader:
                 
                 return signature
             return None
+        except asyncio.TimeoutError:
+            print(format_error(f"Compra abortada: prazo de {TRADE_PATH_BUDGET:.1f}s esgotado sem resposta do bloXroute"))
+            return None
         except (ConnectionClosedError, IncompleteReadError) as e:
             print(format_error(f"Erro na execução da compra: {e}"))
             return None
 
-    async def execute_sell(self):
+    def _buy_confirm_done(self, signature, task):
+        """Callback da tarefa de confirmação da compra: registra o resultado final."""
+        self._pending_confirms.pop(signature, None)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logging.warning("Erro na confirmação da compra %s: %s", signature, exc)
+        elif task.result()[0]:
+            logging.info("Compra %s confirmada na blockchain", signature)
+        else:
+            logging.warning("Compra %s não confirmada dentro do prazo", signature)
+
+    async def wait_buy_confirmation(self, timeout: float):
+        """
+        Aguarda por até `timeout` segundos as confirmações de compra pendentes, sem
+        cancelá-las se o prazo acabar.
+        """
+        if self._pending_confirms:
+            await asyncio.wait(list(self._pending_confirms.values()), timeout=timeout)
+
+    def _build_swap_request(self, *, in_token, out_token, in_amount, compute_price, priority_fee):
+        """Monta o PostRaydiumSwapRequest (compra ou venda) com os parâmetros comuns do config."""
+        return proto.PostRaydiumSwapRequest(
+            owner_address=self.config["owner_address"],
+            in_token=in_token,
+            out_token=out_token,
+            in_amount=in_amount,
+            slippage=self.config["slippage"],
+            # Aumentar o compute_limit para operações com ATAs
+            compute_limit=1400000,
+            compute_price=compute_price,
+            tip=priority_fee,
+        )
+
+    def _sell_request(self, amount, compute_price, priority_fee):
+        """Monta o PostRaydiumSwapRequest de venda do saldo `amount`."""
+        return self._build_swap_request(
+            in_token=self.config["out_token"],
+            out_token=self.config["in_token"],
+            in_amount=amount,
+            compute_price=compute_price,
+            priority_fee=priority_fee
+        )
+
+    def _resolve_fees(self, settings_key):
+        """
+        Compute price e priority fee de self.config[settings_key] ("buy_settings" ou
+        "sell_settings"), convertidos para lamports uma única vez por trader.
+
+        :return: (compute_price, priority_fee, compute_price_sol, priority_fee_sol)
+        """
+        fees = self._fees_cache.get(settings_key)
+        if fees is None:
+            # Obtém as configurações específicas ou usa valores padrão
+            settings = self.config.get(settings_key, {})
+            
+            # Obter valores em SOL e converter para lamports
+            compute_price_sol = settings.get("compute_price_sol", 0.001)
+            priority_fee_sol = settings.get("priority_fee_sol", 0.001)
+            
+            # Converter para lamports
+            compute_price = int(compute_price_sol * LAMPORTS_PER_SOL)
+            priority_fee = int(priority_fee_sol * LAMPORTS_PER_SOL)
+            
+            # Fallback para valores em lamports diretos, se disponíveis
+            if compute_price == 0:
+                compute_price = settings.get("compute_price", 1_000_000)
+            if priority_fee == 0:
+                priority_fee = settings.get("priority_fee", 1_000_000)
+            fees = self._fees_cache[settings_key] = (compute_price, priority_fee, compute_price_sol, priority_fee_sol)
+        return fees
+
+    def _sell_fees(self, fee_multiplier=1.0):
+        """
+        Fees da venda (sell_settings), com fee_multiplier aplicado.
+
+        :return: (compute_price, priority_fee, compute_price_sol, priority_fee_sol)
+        """
+        compute_price, priority_fee, compute_price_sol, priority_fee_sol = self._resolve_fees("sell_settings")
+        if fee_multiplier != 1.0:
+            compute_price = int(compute_price * fee_multiplier)
+            priority_fee = int(priority_fee * fee_multiplier)
+            compute_price_sol *= fee_multiplier
+            priority_fee_sol *= fee_multiplier
+        return compute_price, priority_fee, compute_price_sol, priority_fee_sol
+
+    async def refresh_sell_tx(self):
+        """Constrói a transação de venda do saldo atual e a guarda para execute_sell."""
+        async with self._sell_tx_lock:
+            amount = await get_token_balance(self.config["owner_address"], self.config["out_token"])
+            if not amount or amount <= 0:
+                return
+            compute_price, priority_fee, _, _ = self._sell_fees()
+            request = self._sell_request(amount, compute_price, priority_fee)
+            swap_response = await call_with_budget(
+                lambda: self.api.post_raydium_swap(post_raydium_swap_request=request),
+                SWAP_REQUEST_TIMEOUT, time.monotonic() + TRADE_PATH_BUDGET
+            )
+            tx_entry = swap_response.transactions[0]
+            if getattr(tx_entry, "error", None) or not tx_entry.content:
+                return
+            self._sell_tx_cache = (time.monotonic(), amount, tx_entry.content)
+
+    async def keep_sell_tx_warm(self, interval=SELL_TX_REFRESH_INTERVAL):
+        """
+        Mantém uma transação de venda pré-construída enquanto a posição está aberta
+        (executar em segundo plano durante o monitoramento de lucro e cancelar antes da venda).
+        """
+        while True:
+            try:
+                await self.refresh_sell_tx()
+            except Exception as e:
+                logging.warning("Erro ao pré-construir a transação de venda: %s", e)
+            await asyncio.sleep(interval)
+
+    def _take_sell_tx(self, amount):
+        """Retorna (e consome) a transação pré-construída se ainda for válida para `amount`."""
+        cached, self._sell_tx_cache = self._sell_tx_cache, None
+        if cached and time.monotonic() - cached[0] < SELL_TX_MAX_AGE and cached[1] == amount:
+            return cached[2]
+        return None
+
+    async def execute_sell(self, fee_multiplier: float = 1.0):
         """
         Executa um swap de venda utilizando o endpoint raydium_swap.
         Os parâmetros de submissão para a venda são:
@@ -307,94 +865,78 @@ class RaydiumTrader:
           - frontRunningProtection: False
           - fastBestEffort: False
           - useStakedRPCs: True
+
+        :param fee_multiplier: Fator aplicado ao compute price e à priority fee configurados
+                               (usado pelas variantes de uma venda concorrente).
         """
         owner = self.config["owner_address"]
         token_mint = self.config["out_token"]
         bought_amount = await get_token_balance(owner, token_mint)
+        if (bought_amount is None or bought_amount <= 0) and self._pending_confirms:
+            # Compra ainda sem confirmação: aguarda um pouco e consulta o saldo de novo
+            await self.wait_buy_confirmation(BUY_CONFIRM_WAIT)
+            bought_amount = await get_token_balance(owner, token_mint, ttl=0)
         if bought_amount is None or bought_amount <= 0:
             print(format_error("Saldo de tokens insuficiente para venda"))
             return None
 
-        # Obtém as configurações específicas de venda ou usa valores padrão
-        sell_settings = self.config.get("sell_settings", {})
-        
-        # Converte SOL para lamports (1 SOL = 1,000,000,000 lamports)
-        LAMPORTS_PER_SOL = 1_000_000_000
-        
-        # Obter valores em SOL e converter para lamports
-        compute_price_sol = sell_settings.get("compute_price_sol", 0.001)
-        priority_fee_sol = sell_settings.get("priority_fee_sol", 0.001)
-        
-        # Converter para lamports
-        compute_price = int(compute_price_sol * LAMPORTS_PER_SOL)
-        priority_fee = int(priority_fee_sol * LAMPORTS_PER_SOL)
-        
-        # Fallback para valores em lamports diretos, se disponíveis
-        if compute_price == 0:
-            compute_price = sell_settings.get("compute_price", 1_000_000)
-        if priority_fee == 0:
-            priority_fee = sell_settings.get("priority_fee", 1_000_000)
+        compute_price, priority_fee, compute_price_sol, priority_fee_sol = self._sell_fees(fee_multiplier)
         
         print(f"\n{Fore.WHITE}{Back.BLUE} INICIANDO VENDA {Style.RESET_ALL}")
         print(f"• Compute Price: {format_sol(compute_price_sol)}")
         print(f"• Priority Fee: {format_sol(priority_fee_sol)}")
         print(f"• Quantidade: {Fore.WHITE}{bought_amount:.6f} tokens{Style.RESET_ALL}")
         
-        # Aumentar o compute_limit para operações com ATAs
-        compute_limit = 1400000  # Aumentado de 1400000
-        
-        request = proto.PostRaydiumSwapRequest(
-            owner_address=self.config["owner_address"],
-            in_token=self.config["out_token"],
-            out_token=self.config["in_token"],
-            in_amount=bought_amount,
-            slippage=self.config["slippage"],
-            compute_limit=compute_limit,
-            compute_price=compute_price,
-            tip=priority_fee,
-        )
-        
+        # Prazo contado a partir do saldo conhecido: a espera pela confirmação da compra e as
+        # leituras de saldo não consomem o orçamento da construção e submissão da venda
+        deadline = time.monotonic() + TRADE_PATH_BUDGET
         try:
-            print(format_info("Solicitando construção de transação de venda..."))
-            swap_response = await self.api.post_raydium_swap(post_raydium_swap_request=request)
-            tx_entry = swap_response.transactions[0]
-            if hasattr(tx_entry, "error") and tx_entry.error:
-                print(format_error(f"Erro na transação de venda: {tx_entry.error}"))
-                return None
+            # A transação pré-construída só vale para as fees base (variantes da venda concorrente
+            # com outras fees são sempre construídas na hora)
+            unsigned_tx = self._take_sell_tx(bought_amount) if fee_multiplier == 1.0 else None
+            if unsigned_tx:
+                print(format_info("Usando transação de venda pré-construída..."))
+            else:
+                print(format_info("Solicitando construção de transação de venda..."))
+                request = self._sell_request(bought_amount, compute_price, priority_fee)
+                swap_response = await call_with_budget(
+                    lambda: self.api.post_raydium_swap(post_raydium_swap_request=request),
+                    SWAP_REQUEST_TIMEOUT, deadline
+                )
+                tx_entry = swap_response.transactions[0]
+                if hasattr(tx_entry, "error") and tx_entry.error:
+                    print(format_error(f"Erro na transação de venda: {tx_entry.error}"))
+                    return None
 
-            unsigned_tx = tx_entry.content
-            if not unsigned_tx:
-                print(format_error("Transação unsigned de venda está vazia"))
-                return None
+                unsigned_tx = tx_entry.content
+                if not unsigned_tx:
+                    print(format_error("Transação unsigned de venda está vazia"))
+                    return None
 
             print(format_info("Enviando transação para a blockchain..."))
-            signatures = await self.custom_submit(
-                [unsigned_tx],
-                front_running_protection=False,
-                fast_best_effort=False,
-                use_staked_rpcs=True
-            )
+            signatures = await self.custom_submit([unsigned_tx], **_SELL_SUBMIT_PARAMS)
             
             if signatures:
                 signature = signatures[0]
                 
                 # Exibe assinatura formatada
-                short_sig = signature[:8] + "..." + signature[-8:]
-                print(f"• Assinatura: {Fore.CYAN}{short_sig}{Style.RESET_ALL}")
+                print(_SIG_FMT.format(signature[:8], signature[-8:]))
                 
-                # Verifica a confirmação da transação
+                # Sondagem rápida só para descartar logo uma venda que falhou; a confirmação
+                # (commitment "confirmed") fica com o chamador (confirm_sell)
                 try:
-                    print(format_info("Verificando confirmação na blockchain..."))
-                    confirmed = await verify_transaction_status(signature, max_attempts=15, sleep_time=3)
-                    
-                    if confirmed:
-                        print(format_success("Transação confirmada com sucesso na blockchain"))
-                        return signature
-                    else:
+                    print(format_info("Verificando a transação na blockchain..."))
+                    landed = await probe_landed(signature)
+                    if landed is False:
                         # NÃO retorna a assinatura se a transação falhou
-                        print(format_error("Transação falhou ou não foi confirmada"))
-                        print(f"• Verificar em: {Fore.CYAN}https://solscan.io/tx/{signature}{Style.RESET_ALL}")
+                        print(format_error("Transação de venda falhou"))
+                        print(_SOLSCAN_FMT.format(signature))
                         return None
+                    if landed:
+                        print(format_info("Transação processada; aguardando confirmação"))
+                        spawn_finality_watch(signature)
+                    invalidate_token_balance(owner, token_mint)
+                    return signature
                 except Exception as e:
                     print(format_error(f"Erro ao confirmar transação: {str(e)}"))
                     return None